@@ -2,10 +2,11 @@ from __future__ import with_statement
 
 import os
 import sys
+import time
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import engine_from_config, event, exc, pool
 
 # Add app package roots to path for imports.
 # In Docker image, backend code is copied to /app (contains /app/app).
@@ -29,6 +30,9 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+MIGRATION_LOCK_NAME = "ech_swarm_migrations"
+MIGRATION_LOCK_POLL_SECONDS = 1.0
+
 
 def get_database_url() -> str:
     settings = get_settings()
@@ -50,8 +54,32 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _acquire_migration_lock(connection) -> None:
+    # Replicas that boot together would otherwise race through the same revisions, and
+    # the concurrent index builds run outside any transaction that could serialize them.
+    # The session-level lock spans those autocommit blocks; it is released when the
+    # NullPool connection closes. A waiting replica then finds the schema at head.
+    # Waiting replicas poll with short autocommit statements rather than blocking in
+    # pg_advisory_lock: a blocked statement holds a snapshot, and the lock holder's
+    # CREATE INDEX CONCURRENTLY waits for every older snapshot, so the two deadlock.
+    connection.execution_options(isolation_level="AUTOCOMMIT")
+    try:
+        while not connection.exec_driver_sql(
+            f"SELECT pg_try_advisory_lock(hashtext('{MIGRATION_LOCK_NAME}'))"
+        ).scalar():
+            time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+    finally:
+        connection.commit()
+        connection.execution_options(isolation_level=connection.default_isolation_level)
+
+
+def _is_lock_timeout(error: exc.DBAPIError) -> bool:
+    return getattr(error.orig, "pgcode", None) == "55P03"  # lock_not_available
+
+
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
+    settings = get_settings()
     configuration = config.get_section(config.config_ini_section)
     configuration["sqlalchemy.url"] = get_database_url()
 
@@ -61,16 +89,34 @@ def run_migrations_online() -> None:
         poolclass=pool.NullPool,
     )
 
-    with connectable.connect() as connection:
-        context.configure(
-            connection=connection,
-            target_metadata=target_metadata,
-            compare_type=True,
-            compare_server_default=True,
-        )
-
-        with context.begin_transaction():
-            context.run_migrations()
+    @event.listens_for(connectable, "begin")
+    def _set_lock_timeout(connection) -> None:
+        # Only transactional DDL gets the timeout: concurrent index builds inside
+        # autocommit blocks must be allowed to wait for older transactions.
+        if connection.get_execution_options().get("isolation_level") == "AUTOCOMMIT":
+            return
+        connection.exec_driver_sql(f"SET LOCAL lock_timeout = '{settings.migration_lock_timeout}'")
+
+    for attempt in range(settings.migration_lock_retries + 1):
+        try:
+            with connectable.connect() as connection:
+                _acquire_migration_lock(connection)
+                context.configure(
+                    connection=connection,
+                    target_metadata=target_metadata,
+                    compare_type=True,
+                    compare_server_default=True,
+                )
+
+                with context.begin_transaction():
+                    context.run_migrations()
+            return
+        except exc.OperationalError as error:
+            # The failed transaction rolled back; already committed revisions are skipped
+            # on the next attempt.
+            if not _is_lock_timeout(error) or attempt == settings.migration_lock_retries:
+                raise
+            time.sleep(2**attempt)
 
 
 if context.is_offline_mode():
@@ -0,0 +1,48 @@
+"""Catalog probes shared by the revisions in alembic/versions.
+
+alembic.ini puts this directory on sys.path, so revisions import it as
+`from migration_helpers import ...`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def index_validity(bind, names) -> dict[str, bool]:
+    """indisvalid for each existing index in `names`, read in one catalog query."""
+    rows = bind.execute(
+        sa.text(
+            "SELECT c.relname, i.indisvalid FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid "
+            "WHERE c.relkind = 'i' AND c.relname = ANY(:names)"
+        ),
+        {"names": list(names)},
+    )
+    return {name: valid for name, valid in rows}
+
+
+def drop_invalid_indexes(names) -> set[str]:
+    """Drop the INVALID indexes among `names` and return the names of the valid ones.
+
+    An interrupted CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which a
+    rerun with IF NOT EXISTS would silently keep. Run inside an autocommit block.
+    """
+    valid = set()
+    for name, is_valid in index_validity(op.get_bind(), names).items():
+        if is_valid:
+            valid.add(name)
+        else:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    return valid
+
+
+def constraint_exists(name: str) -> bool:
+    bind = op.get_bind()
+    return bind.execute(sa.text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": name}).scalar() is not None
+
+
+def pgvector_version() -> tuple[int, ...]:
+    bind = op.get_bind()
+    version = bind.execute(sa.text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")).scalar()
+    if not version:
+        return (0,)
+    return tuple(int(part) for part in version.split(".") if part.isdigit())
@@ -38,10 +38,21 @@ def upgrade():
     op.create_index("ix_constitution_ack_user_version", "constitution_ack", ["user_id", "version"])
     op.create_index("ix_constitution_ack_user_id", "constitution_ack", ["user_id"])
 
-    # Seed initial constitution version
+    # Seed initial constitution version. Seed rows share one multi-row INSERT, and
+    # updated_at is the server's NOW() at migration time.
+    constitution_meta = sa.table(
+        "constitution_meta",
+        sa.column("version", sa.String),
+        sa.column("file_url", sa.String),
+        sa.column("is_active", sa.Boolean),
+        sa.column("updated_at", sa.DateTime),
+    )
     op.execute(
-        "INSERT INTO constitution_meta (version, file_url, is_active, updated_at) "
-        "VALUES ('v1', '/Constitution.docx', true, NOW())"
+        constitution_meta.insert().values(
+            [
+                {"version": "v1", "file_url": "/Constitution.docx", "is_active": True, "updated_at": sa.func.now()},
+            ]
+        )
     )
 
 
@@ -1,12 +1,14 @@
 """add minimal performance indexes
 
 Revision ID: 20260211_add_min_indexes
-Revises: 
+Revises:
 Create Date: 2026-02-11
 """
 
 from alembic import op
 
+from migration_helpers import drop_invalid_indexes
+
 # revision identifiers, used by Alembic.
 revision = "20260211_add_min_indexes"
 down_revision = None
@@ -17,45 +19,84 @@ depends_on = None
 def upgrade():
     op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
 
-    op.create_index(
-        "ix_articles_original_title_trgm",
-        "articles",
-        ["original_title"],
-        postgresql_using="gin",
-        postgresql_ops={"original_title": "gin_trgm_ops"},
-    )
-
-    op.create_index(
-        "ix_articles_title_ar_trgm",
-        "articles",
-        ["title_ar"],
-        postgresql_using="gin",
-        postgresql_ops={"title_ar": "gin_trgm_ops"},
-    )
-
-    op.create_index(
-        "ix_articles_published_at",
-        "articles",
-        ["published_at"],
-        postgresql_using="btree",
-    )
-
-    op.create_index(
-        "ix_articles_candidate_order",
-        "articles",
-        ["status", "importance_score", "crawled_at"],
-    )
-
-    op.create_index(
-        "ix_editor_decisions_article_id",
-        "editor_decisions",
-        ["article_id"],
-    )
+    # `articles` is already populated when this runs: build every index CONCURRENTLY
+    # (outside the migration transaction) so writers are never blocked. Cheap btrees
+    # go first; the trigram GIN builds dominate and run last with extra sort memory.
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes(
+            [
+                "ix_editor_decisions_article_id",
+                "ix_articles_published_at",
+                "ix_articles_candidate_order",
+                "ix_articles_original_title_trgm",
+                "ix_articles_title_ar_trgm",
+            ]
+        )
+
+        op.create_index(
+            "ix_editor_decisions_article_id",
+            "editor_decisions",
+            ["article_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.create_index(
+            "ix_articles_published_at",
+            "articles",
+            ["published_at"],
+            postgresql_using="btree",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.create_index(
+            "ix_articles_candidate_order",
+            "articles",
+            ["status", "importance_score", "crawled_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.execute("SET maintenance_work_mem = '1GB'")
+
+        op.create_index(
+            "ix_articles_original_title_trgm",
+            "articles",
+            ["original_title"],
+            postgresql_using="gin",
+            postgresql_ops={"original_title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.create_index(
+            "ix_articles_title_ar_trgm",
+            "articles",
+            ["title_ar"],
+            postgresql_using="gin",
+            postgresql_ops={"title_ar": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+        op.execute("RESET maintenance_work_mem")
 
 
 def downgrade():
-    op.drop_index("ix_editor_decisions_article_id", table_name="editor_decisions")
-    op.drop_index("ix_articles_candidate_order", table_name="articles")
-    op.drop_index("ix_articles_published_at", table_name="articles")
-    op.drop_index("ix_articles_title_ar_trgm", table_name="articles")
-    op.drop_index("ix_articles_original_title_trgm", table_name="articles")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_articles_title_ar_trgm", table_name="articles", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "ix_articles_original_title_trgm",
+            table_name="articles",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index("ix_articles_candidate_order", table_name="articles", postgresql_concurrently=True, if_exists=True)
+        op.drop_index("ix_articles_published_at", table_name="articles", postgresql_concurrently=True, if_exists=True)
+        op.drop_index(
+            "ix_editor_decisions_article_id",
+            table_name="editor_decisions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
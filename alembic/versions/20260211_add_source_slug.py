@@ -14,18 +14,37 @@ down_revision = "20260211_add_source_fields"
 branch_labels = None
 depends_on = None
 
+BACKFILL_BATCH_SIZE = 10000
+
 
 def upgrade():
     op.add_column("sources", sa.Column("slug", sa.String(length=255), nullable=True))
-    # Best-effort slug fill: lower + replace spaces with '-'
-    op.execute("UPDATE sources SET slug = lower(replace(name, ' ', '-')) WHERE slug IS NULL")
-    op.create_index(
-        "ux_sources_slug",
-        "sources",
-        ["slug"],
-        unique=True,
-        postgresql_where=sa.text("slug IS NOT NULL"),
-    )
+
+    # Best-effort slug fill: lower + replace spaces with '-'.
+    # Runs in id windows, each committed on its own, so row locks and WAL stay bounded
+    # on large `sources` tables; the unique index is built concurrently afterwards.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        min_id, max_id = bind.execute(sa.text("SELECT min(id), max(id) FROM sources")).one()
+        if min_id is not None:
+            for lo in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+                bind.execute(
+                    sa.text(
+                        "UPDATE sources SET slug = lower(replace(name, ' ', '-')) "
+                        "WHERE slug IS NULL AND id BETWEEN :lo AND :hi"
+                    ),
+                    {"lo": lo, "hi": lo + BACKFILL_BATCH_SIZE - 1},
+                )
+
+        op.create_index(
+            "ux_sources_slug",
+            "sources",
+            ["slug"],
+            unique=True,
+            postgresql_where=sa.text("slug IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade():
@@ -109,10 +109,6 @@ def upgrade() -> None:
     op.create_index("ix_article_vectors_vector_type", "article_vectors", ["vector_type"], unique=False)
     op.create_index("ix_article_vectors_content_hash", "article_vectors", ["content_hash"], unique=False)
     op.create_index("ix_article_vectors_article_type", "article_vectors", ["article_id", "vector_type"], unique=False)
-    op.execute(
-        "CREATE INDEX IF NOT EXISTS ix_article_vectors_embedding_ivfflat "
-        "ON article_vectors USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
-    )
 
     op.create_table(
         "story_clusters",
@@ -141,6 +137,14 @@ def upgrade() -> None:
     op.create_index("ix_story_cluster_members_cluster_id", "story_cluster_members", ["cluster_id"], unique=False)
     op.create_index("ix_story_cluster_members_article_id", "story_cluster_members", ["article_id"], unique=False)
 
+    # ANN index goes last, once every table and b-tree index is in place. article_vectors
+    # was created above and is still empty, so `lists` is pgvector's floor of 100.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_article_vectors_embedding_ivfflat "
+            "ON article_vectors USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)"
+        )
+
 
 def downgrade() -> None:
     op.drop_index("ix_story_cluster_members_article_id", table_name="story_cluster_members")
@@ -152,7 +156,8 @@ def downgrade() -> None:
     op.drop_index("ix_story_clusters_cluster_key", table_name="story_clusters")
     op.drop_table("story_clusters")
 
-    op.execute("DROP INDEX IF EXISTS ix_article_vectors_embedding_ivfflat")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_article_vectors_embedding_ivfflat")
     op.drop_index("ix_article_vectors_article_type", table_name="article_vectors")
     op.drop_index("ix_article_vectors_content_hash", table_name="article_vectors")
     op.drop_index("ix_article_vectors_vector_type", table_name="article_vectors")
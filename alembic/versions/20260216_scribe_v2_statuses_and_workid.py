@@ -16,35 +16,51 @@ branch_labels = None
 depends_on = None
 
 
+def _swap_work_id_index(unique: bool) -> None:
+    # Build the replacement concurrently before dropping the old index, so drafts stay
+    # writable and work_id lookups stay indexed throughout.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_editorial_drafts_work_id_new",
+            "editorial_drafts",
+            ["work_id"],
+            unique=unique,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_editorial_drafts_work_id",
+            table_name="editorial_drafts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER INDEX ix_editorial_drafts_work_id_new RENAME TO ix_editorial_drafts_work_id")
+
+
 def upgrade() -> None:
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'approved_handoff'")
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'draft_generated'")
+    # The Scribe v2 newsstatus labels are added (upper case, as the ORM stores them)
+    # by 20260217_newsstatus_case_fix.
 
     # editorial_drafts.work_id must support multiple versions under same work_id.
-    op.execute(
-        """
-        DO $$
-        DECLARE
-            _cname text;
-        BEGIN
-            SELECT conname INTO _cname
-            FROM pg_constraint
-            WHERE conrelid = 'editorial_drafts'::regclass
-              AND contype = 'u'
-              AND conkey = ARRAY[
-                (SELECT attnum FROM pg_attribute WHERE attrelid='editorial_drafts'::regclass AND attname='work_id')
-              ];
-            IF _cname IS NOT NULL THEN
-                EXECUTE format('ALTER TABLE editorial_drafts DROP CONSTRAINT %I', _cname);
-            END IF;
-        END $$;
-        """
-    )
-    op.drop_index("ix_editorial_drafts_work_id", table_name="editorial_drafts")
-    op.create_index("ix_editorial_drafts_work_id", "editorial_drafts", ["work_id"], unique=False)
+    bind = op.get_bind()
+    work_id_unique = bind.execute(
+        sa.text(
+            """
+            SELECT c.conname
+            FROM pg_constraint c
+            JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = c.conkey[1]
+            WHERE c.conrelid = 'editorial_drafts'::regclass
+              AND c.contype = 'u'
+              AND cardinality(c.conkey) = 1
+              AND a.attname = 'work_id'
+            """
+        )
+    ).scalar()
+    if work_id_unique:
+        op.drop_constraint(work_id_unique, "editorial_drafts", type_="unique")
+    _swap_work_id_index(unique=False)
 
 
 def downgrade() -> None:
-    op.drop_index("ix_editorial_drafts_work_id", table_name="editorial_drafts")
-    op.create_index("ix_editorial_drafts_work_id", "editorial_drafts", ["work_id"], unique=True)
+    _swap_work_id_index(unique=True)
     # Downgrade does not remove enum values from PostgreSQL type safely.
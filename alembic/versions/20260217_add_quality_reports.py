@@ -8,6 +8,8 @@ Create Date: 2026-02-17 13:20:00
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import drop_invalid_indexes
+
 
 revision = "20260217_quality_reports"
 down_revision = "20260217_single_cluster_member"
@@ -36,22 +38,24 @@ def upgrade() -> None:
         )
 
     # Keep migration idempotent for environments where table was pre-created manually.
-    op.execute(
-        "CREATE INDEX IF NOT EXISTS ix_article_quality_reports_article_id "
-        "ON article_quality_reports (article_id)"
-    )
-    op.execute(
-        "CREATE INDEX IF NOT EXISTS ix_article_quality_reports_stage "
-        "ON article_quality_reports (stage)"
-    )
-    op.execute(
-        "CREATE INDEX IF NOT EXISTS ix_quality_article_stage_created "
-        "ON article_quality_reports (article_id, stage, created_at)"
-    )
+    # Such a table may already hold reports, so build concurrently to keep writes flowing,
+    # and skip indexes that already exist: even CREATE INDEX IF NOT EXISTS queues for a
+    # table lock behind long-running transactions before it can notice the index.
+    indexes = {
+        "ix_article_quality_reports_article_id": "(article_id)",
+        "ix_article_quality_reports_stage": "(stage)",
+        "ix_quality_article_stage_created": "(article_id, stage, created_at)",
+    }
+    with op.get_context().autocommit_block():
+        built = drop_invalid_indexes(indexes)
+        for name, columns in indexes.items():
+            if name not in built:
+                op.execute(f"CREATE INDEX CONCURRENTLY {name} ON article_quality_reports {columns}")
 
 
 def downgrade() -> None:
-    op.execute("DROP INDEX IF EXISTS ix_quality_article_stage_created")
-    op.execute("DROP INDEX IF EXISTS ix_article_quality_reports_stage")
-    op.execute("DROP INDEX IF EXISTS ix_article_quality_reports_article_id")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_quality_article_stage_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_article_quality_reports_stage")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_article_quality_reports_article_id")
     op.execute("DROP TABLE IF EXISTS article_quality_reports")
@@ -6,6 +6,9 @@ Create Date: 2026-02-17 12:10:00
 """
 
 from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import constraint_exists, drop_invalid_indexes
 
 
 # revision identifiers, used by Alembic.
@@ -14,63 +17,86 @@ down_revision = "20260216_fingerprints_relations"
 branch_labels = None
 depends_on = None
 
+DEDUP_BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
     # Keep one row per article_id (largest cluster first, then best score).
-    op.execute(
-        """
-        WITH cluster_sizes AS (
-            SELECT cluster_id, COUNT(*)::int AS members
-            FROM story_cluster_members
-            GROUP BY cluster_id
-        ),
-        ranked AS (
-            SELECT
-                scm.id,
-                ROW_NUMBER() OVER (
-                    PARTITION BY scm.article_id
-                    ORDER BY cs.members DESC, scm.score DESC, scm.id ASC
-                ) AS rn
-            FROM story_cluster_members scm
-            JOIN cluster_sizes cs ON cs.cluster_id = scm.cluster_id
+    # The losing rows are collected once into an indexed temp table, then deleted in
+    # short autocommitted batches so no single transaction holds locks or WAL for the
+    # whole table.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        bind.execute(sa.text("DROP TABLE IF EXISTS scm_drop"))
+        bind.execute(sa.text("DROP TABLE IF EXISTS scm_sizes"))
+        # Cluster sizes are materialized and indexed first so the ranking below joins
+        # against a small analyzed table instead of re-aggregating inline.
+        bind.execute(
+            sa.text(
+                """
+                CREATE TEMP TABLE scm_sizes AS
+                SELECT cluster_id, COUNT(*)::int AS members
+                FROM story_cluster_members
+                GROUP BY cluster_id
+                """
+            )
+        )
+        bind.execute(sa.text("CREATE INDEX ON scm_sizes (cluster_id)"))
+        bind.execute(sa.text("ANALYZE scm_sizes"))
+        bind.execute(
+            sa.text(
+                """
+                CREATE TEMP TABLE scm_drop AS
+                SELECT id
+                FROM (
+                    SELECT
+                        scm.id,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY scm.article_id
+                            ORDER BY cs.members DESC, scm.score DESC, scm.id ASC
+                        ) AS rn
+                    FROM story_cluster_members scm
+                    JOIN scm_sizes cs ON cs.cluster_id = scm.cluster_id
+                ) ranked
+                WHERE rn > 1
+                """
+            )
         )
-        DELETE FROM story_cluster_members scm
-        USING ranked r
-        WHERE scm.id = r.id
-          AND r.rn > 1;
-        """
-    )
+        bind.execute(sa.text("CREATE INDEX ON scm_drop (id)"))
+
+        last_id = 0
+        while True:
+            upper = bind.execute(
+                sa.text(
+                    "SELECT max(id) FROM (SELECT id FROM scm_drop WHERE id > :last ORDER BY id LIMIT :size) batch"
+                ),
+                {"last": last_id, "size": DEDUP_BATCH_SIZE},
+            ).scalar()
+            if upper is None:
+                break
+            bind.execute(
+                sa.text(
+                    "DELETE FROM story_cluster_members scm USING scm_drop d "
+                    "WHERE scm.id = d.id AND d.id > :last AND d.id <= :upper"
+                ),
+                {"last": last_id, "upper": upper},
+            )
+            last_id = upper
+
+        bind.execute(sa.text("DROP TABLE scm_drop"))
+        bind.execute(sa.text("DROP TABLE scm_sizes"))
 
-    op.execute(
-        """
-        DO $$
-        BEGIN
-          IF NOT EXISTS (
-            SELECT 1
-            FROM pg_constraint
-            WHERE conname = 'uq_story_cluster_member_article'
-          ) THEN
-            ALTER TABLE story_cluster_members
-              ADD CONSTRAINT uq_story_cluster_member_article UNIQUE (article_id);
-          END IF;
-        END $$;
-        """
-    )
+    # Build the unique index concurrently, then attach it as the constraint: the
+    # attach is a catalog-only change instead of an index build under ACCESS EXCLUSIVE.
+    # A member inserted after the batched dedup fails the build and leaves an INVALID
+    # index behind; drop it so a rerun dedups again and rebuilds rather than attaching it.
+    with op.get_context().autocommit_block():
+        if "uq_story_cluster_member_article" not in drop_invalid_indexes(["uq_story_cluster_member_article"]):
+            op.execute("CREATE UNIQUE INDEX CONCURRENTLY uq_story_cluster_member_article ON story_cluster_members (article_id)")
+    if not constraint_exists("uq_story_cluster_member_article"):
+        op.execute("ALTER TABLE story_cluster_members ADD CONSTRAINT uq_story_cluster_member_article UNIQUE USING INDEX uq_story_cluster_member_article")
 
 
 def downgrade() -> None:
-    op.execute(
-        """
-        DO $$
-        BEGIN
-          IF EXISTS (
-            SELECT 1
-            FROM pg_constraint
-            WHERE conname = 'uq_story_cluster_member_article'
-          ) THEN
-            ALTER TABLE story_cluster_members
-              DROP CONSTRAINT uq_story_cluster_member_article;
-          END IF;
-        END $$;
-        """
-    )
+    if constraint_exists("uq_story_cluster_member_article"):
+        op.drop_constraint("uq_story_cluster_member_article", "story_cluster_members", type_="unique")
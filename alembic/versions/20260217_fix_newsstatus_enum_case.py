@@ -6,6 +6,7 @@ Create Date: 2026-02-17 12:45:00
 """
 
 from alembic import op
+import sqlalchemy as sa
 
 
 # revision identifiers, used by Alembic.
@@ -14,28 +15,73 @@ down_revision = "20260217_quality_reports"
 branch_labels = None
 depends_on = None
 
+UPDATE_BATCH_SIZE = 5000
+LABEL_FIXES = {
+    "approved_handoff": "APPROVED_HANDOFF",
+    "draft_generated": "DRAFT_GENERATED",
+}
+
 
 def upgrade() -> None:
     # SQLAlchemy Enum(NewsStatus) persists enum names (UPPER_CASE), not values.
-    # Ensure those labels exist in PostgreSQL enum for new Scribe v2 states.
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'APPROVED_HANDOFF'")
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'DRAFT_GENERATED'")
-
-    # Normalize old lowercase rows (if any) to uppercase labels expected by ORM.
-    op.execute(
-        """
-        UPDATE articles
-        SET status = 'APPROVED_HANDOFF'::newsstatus
-        WHERE status::text = 'approved_handoff';
-        """
-    )
-    op.execute(
-        """
-        UPDATE articles
-        SET status = 'DRAFT_GENERATED'::newsstatus
-        WHERE status::text = 'draft_generated';
-        """
-    )
+    # Ensure those labels exist in PostgreSQL enum for new Scribe v2 states. All labels
+    # are read once from pg_enum and only missing ones are added, in one autocommit
+    # block so the additions are committed before the rows below use them.
+    #
+    # Then normalize old lowercase rows (if any) to the uppercase labels. Only labels
+    # actually present in the enum can be stored, so compare enum to enum
+    # (status::text is not indexable: enum output is not IMMUTABLE) through a temporary
+    # partial index, and rewrite rows in short autocommitted batches so no single
+    # transaction scans or locks the whole table.
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        labels = set(
+            bind.execute(
+                sa.text(
+                    "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+                    "WHERE t.typname = 'newsstatus'"
+                )
+            ).scalars()
+        )
+        for label in LABEL_FIXES.values():
+            if label not in labels:
+                op.execute(f"ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS '{label}'")
+
+        legacy = [label for label in LABEL_FIXES if label in labels]
+        if not legacy:
+            return
+
+        # The index holds only legacy rows and its predicate implies each batch's
+        # `status = <label>`, so every batch is an index scan over affected rows only.
+        # A leftover from an interrupted run may be invalid and is rebuilt.
+        predicate = ", ".join(f"'{label}'::newsstatus" for label in legacy)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS tmp_status_legacy")
+        op.execute(f"CREATE INDEX CONCURRENTLY tmp_status_legacy ON articles (status) WHERE status IN ({predicate})")
+
+        for old in legacy:
+            while True:
+                updated = bind.execute(
+                    sa.text(
+                        """
+                        WITH batch AS (
+                            SELECT id
+                            FROM articles
+                            WHERE status = CAST(:old AS newsstatus)
+                            LIMIT :size
+                            FOR UPDATE SKIP LOCKED
+                        )
+                        UPDATE articles
+                        SET status = CAST(:new AS newsstatus)
+                        FROM batch
+                        WHERE articles.id = batch.id
+                        """
+                    ),
+                    {"old": old, "new": LABEL_FIXES[old], "size": UPDATE_BATCH_SIZE},
+                ).rowcount
+                if not updated:
+                    break
+
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS tmp_status_legacy")
 
 
 def downgrade() -> None:
@@ -8,83 +8,114 @@ Create Date: 2026-02-17 16:00:00
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import constraint_exists, drop_invalid_indexes
+
 
 revision = "20260217_m5_smart_editor"
 down_revision = "20260217_newsstatus_case_fix"
 branch_labels = None
 depends_on = None
 
+DEDUP_BATCH_SIZE = 10000
+
+
+def _column_names(table: str) -> set[str]:
+    # Only names are needed, so read pg_attribute directly instead of full reflection.
+    bind = op.get_bind()
+    return set(
+        bind.execute(
+            sa.text(
+                "SELECT attname FROM pg_attribute "
+                "WHERE attrelid = CAST(:table AS regclass) AND attnum > 0 AND NOT attisdropped"
+            ),
+            {"table": table},
+        ).scalars()
+    )
+
 
 def upgrade() -> None:
     bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    cols = {c["name"] for c in inspector.get_columns("editorial_drafts")}
+    cols = _column_names("editorial_drafts")
 
     if "parent_draft_id" not in cols:
         op.add_column("editorial_drafts", sa.Column("parent_draft_id", sa.Integer(), nullable=True))
-        op.create_foreign_key(
-            "fk_editorial_drafts_parent_draft",
-            "editorial_drafts",
-            "editorial_drafts",
-            ["parent_draft_id"],
-            ["id"],
+        # Add the FK NOT VALID (catalog-only) and validate it in its own transaction,
+        # which scans under SHARE UPDATE EXCLUSIVE and leaves drafts writable.
+        op.execute(
+            "ALTER TABLE editorial_drafts ADD CONSTRAINT fk_editorial_drafts_parent_draft "
+            "FOREIGN KEY (parent_draft_id) REFERENCES editorial_drafts (id) NOT VALID"
         )
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TABLE editorial_drafts VALIDATE CONSTRAINT fk_editorial_drafts_parent_draft")
 
     if "change_origin" not in cols:
+        # NOT NULL with a constant default is catalog-only (existing rows read the stored
+        # default), so no backfill UPDATE or table rewrite is needed.
         op.add_column(
             "editorial_drafts",
-            sa.Column("change_origin", sa.String(length=40), nullable=True, server_default="manual"),
+            sa.Column("change_origin", sa.String(length=40), nullable=False, server_default="manual"),
         )
-        op.execute("UPDATE editorial_drafts SET change_origin = 'manual' WHERE change_origin IS NULL")
-        op.alter_column("editorial_drafts", "change_origin", nullable=False, server_default=None)
-
-    # Ensure work_id+version is unique for deterministic version history.
-    op.execute(
-        """
-        DELETE FROM editorial_drafts d
-        USING editorial_drafts x
-        WHERE d.work_id = x.work_id
-          AND d.version = x.version
-          AND d.id < x.id;
-        """
-    )
-    op.execute(
-        """
-        DO $$
-        BEGIN
-          IF NOT EXISTS (
-            SELECT 1
-            FROM pg_constraint
-            WHERE conname = 'uq_draft_work_version'
-          ) THEN
-            ALTER TABLE editorial_drafts
-              ADD CONSTRAINT uq_draft_work_version UNIQUE (work_id, version);
-          END IF;
-        END $$;
-        """
-    )
+        op.alter_column("editorial_drafts", "change_origin", server_default=None)
+
+    # Ensure work_id+version is unique for deterministic version history (latest id wins).
+    # Losers are collected once into an indexed temp table and deleted in short
+    # autocommitted batches instead of one whole-table self-join.
+    with op.get_context().autocommit_block():
+        bind.execute(sa.text("DROP TABLE IF EXISTS ed_losers"))
+        bind.execute(
+            sa.text(
+                """
+                CREATE TEMP TABLE ed_losers AS
+                SELECT id
+                FROM (
+                    SELECT
+                        id,
+                        ROW_NUMBER() OVER (PARTITION BY work_id, version ORDER BY id DESC) AS rn
+                    FROM editorial_drafts
+                ) ranked
+                WHERE rn > 1
+                """
+            )
+        )
+        bind.execute(sa.text("CREATE INDEX ON ed_losers (id)"))
+
+        last_id = 0
+        while True:
+            upper = bind.execute(
+                sa.text(
+                    "SELECT max(id) FROM (SELECT id FROM ed_losers WHERE id > :last ORDER BY id LIMIT :size) batch"
+                ),
+                {"last": last_id, "size": DEDUP_BATCH_SIZE},
+            ).scalar()
+            if upper is None:
+                break
+            bind.execute(
+                sa.text(
+                    "DELETE FROM editorial_drafts d USING ed_losers l "
+                    "WHERE d.id = l.id AND l.id > :last AND l.id <= :upper"
+                ),
+                {"last": last_id, "upper": upper},
+            )
+            last_id = upper
+
+        bind.execute(sa.text("DROP TABLE ed_losers"))
+
+    # Build the unique index concurrently, then attach it as the constraint: the
+    # attach is a catalog-only change instead of an index build under ACCESS EXCLUSIVE.
+    # Drafts saved between the dedup and the build can fail it; an INVALID leftover is
+    # dropped and rebuilt on the rerun, after the dedup has run again.
+    with op.get_context().autocommit_block():
+        if "uq_draft_work_version" not in drop_invalid_indexes(["uq_draft_work_version"]):
+            op.execute("CREATE UNIQUE INDEX CONCURRENTLY uq_draft_work_version ON editorial_drafts (work_id, version)")
+    if not constraint_exists("uq_draft_work_version"):
+        op.execute("ALTER TABLE editorial_drafts ADD CONSTRAINT uq_draft_work_version UNIQUE USING INDEX uq_draft_work_version")
 
 
 def downgrade() -> None:
-    op.execute(
-        """
-        DO $$
-        BEGIN
-          IF EXISTS (
-            SELECT 1
-            FROM pg_constraint
-            WHERE conname = 'uq_draft_work_version'
-          ) THEN
-            ALTER TABLE editorial_drafts
-              DROP CONSTRAINT uq_draft_work_version;
-          END IF;
-        END $$;
-        """
-    )
+    if constraint_exists("uq_draft_work_version"):
+        op.drop_constraint("uq_draft_work_version", "editorial_drafts", type_="unique")
 
-    bind = op.get_bind()
-    inspector = sa.inspect(bind)
-    cols = {c["name"] for c in inspector.get_columns("editorial_drafts")}
+    cols = _column_names("editorial_drafts")
 
     if "change_origin" in cols:
         op.drop_column("editorial_drafts", "change_origin")
@@ -30,23 +30,13 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["actor_user_id"], ["users.id"]),
         sa.ForeignKeyConstraint(["target_user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index("ix_user_activity_logs_action", "user_activity_logs", ["action"], unique=False)
-    op.create_index("ix_user_activity_logs_actor_username", "user_activity_logs", ["actor_username"], unique=False)
-    op.create_index("ix_user_activity_logs_created_at", "user_activity_logs", ["created_at"], unique=False)
-    op.create_index("ix_user_activity_logs_target_username", "user_activity_logs", ["target_username"], unique=False)
-    op.create_index(
-        "ix_user_activity_target_created_at",
-        "user_activity_logs",
-        ["target_user_id", "created_at"],
-        unique=False,
+        sa.Index("ix_user_activity_logs_action", "action"),
+        sa.Index("ix_user_activity_logs_actor_username", "actor_username"),
+        sa.Index("ix_user_activity_logs_created_at", "created_at"),
+        sa.Index("ix_user_activity_logs_target_username", "target_username"),
+        sa.Index("ix_user_activity_target_created_at", "target_user_id", "created_at"),
     )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_user_activity_target_created_at", table_name="user_activity_logs")
-    op.drop_index("ix_user_activity_logs_target_username", table_name="user_activity_logs")
-    op.drop_index("ix_user_activity_logs_created_at", table_name="user_activity_logs")
-    op.drop_index("ix_user_activity_logs_actor_username", table_name="user_activity_logs")
-    op.drop_index("ix_user_activity_logs_action", table_name="user_activity_logs")
     op.drop_table("user_activity_logs")
@@ -6,6 +6,7 @@ Create Date: 2026-02-18 10:00:00
 """
 
 from alembic import op
+import sqlalchemy as sa
 
 
 revision = "20260218_policy_gate_statuses"
@@ -13,11 +14,27 @@ down_revision = "20260217_m5_smart_editor"
 branch_labels = None
 depends_on = None
 
+POLICY_GATE_LABELS = (
+    "ready_for_chief_approval",
+    "approval_request_with_reservations",
+    "ready_for_manual_publish",
+)
+
 
 def upgrade() -> None:
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'ready_for_chief_approval'")
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'approval_request_with_reservations'")
-    op.execute("ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS 'ready_for_manual_publish'")
+    # Add only labels missing from pg_enum, so reruns issue no ALTER TYPE at all.
+    bind = op.get_bind()
+    existing = set(
+        bind.execute(
+            sa.text(
+                "SELECT e.enumlabel FROM pg_enum e JOIN pg_type t ON t.oid = e.enumtypid "
+                "WHERE t.typname = 'newsstatus'"
+            )
+        ).scalars()
+    )
+    for label in POLICY_GATE_LABELS:
+        if label not in existing:
+            op.execute(f"ALTER TYPE newsstatus ADD VALUE IF NOT EXISTS '{label}'")
 
 
 def downgrade() -> None:
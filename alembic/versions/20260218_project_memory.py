@@ -38,17 +38,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["created_by_user_id"], ["users.id"]),
         sa.ForeignKeyConstraint(["updated_by_user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index("ix_project_memory_items_memory_type", "project_memory_items", ["memory_type"], unique=False)
-    op.create_index("ix_project_memory_items_status", "project_memory_items", ["status"], unique=False)
-    op.create_index("ix_project_memory_items_article_id", "project_memory_items", ["article_id"], unique=False)
-    op.create_index("ix_project_memory_items_created_by_user_id", "project_memory_items", ["created_by_user_id"], unique=False)
-    op.create_index("ix_project_memory_items_updated_by_user_id", "project_memory_items", ["updated_by_user_id"], unique=False)
-    op.create_index(
-        "ix_project_memory_type_status_updated",
-        "project_memory_items",
-        ["memory_type", "status", "updated_at"],
-        unique=False,
+        sa.Index("ix_project_memory_items_memory_type", "memory_type"),
+        sa.Index("ix_project_memory_items_status", "status"),
+        sa.Index("ix_project_memory_items_article_id", "article_id"),
+        sa.Index("ix_project_memory_items_created_by_user_id", "created_by_user_id"),
+        sa.Index("ix_project_memory_items_updated_by_user_id", "updated_by_user_id"),
+        sa.Index("ix_project_memory_type_status_updated", "memory_type", "status", "updated_at"),
     )
 
     op.create_table(
@@ -63,29 +58,14 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["memory_id"], ["project_memory_items.id"], ondelete="CASCADE"),
         sa.ForeignKeyConstraint(["actor_user_id"], ["users.id"]),
         sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index("ix_project_memory_events_memory_id", "project_memory_events", ["memory_id"], unique=False)
-    op.create_index("ix_project_memory_events_event_type", "project_memory_events", ["event_type"], unique=False)
-    op.create_index("ix_project_memory_events_actor_user_id", "project_memory_events", ["actor_user_id"], unique=False)
-    op.create_index(
-        "ix_project_memory_events_memory_created",
-        "project_memory_events",
-        ["memory_id", "created_at"],
-        unique=False,
+        # (memory_id, created_at) also serves memory_id lookups and the ON DELETE CASCADE
+        # scan from project_memory_items, so no separate memory_id index is created.
+        sa.Index("ix_project_memory_events_memory_created", "memory_id", "created_at"),
+        sa.Index("ix_project_memory_events_event_type", "event_type"),
+        sa.Index("ix_project_memory_events_actor_user_id", "actor_user_id"),
     )
 
 
 def downgrade() -> None:
-    op.drop_index("ix_project_memory_events_memory_created", table_name="project_memory_events")
-    op.drop_index("ix_project_memory_events_actor_user_id", table_name="project_memory_events")
-    op.drop_index("ix_project_memory_events_event_type", table_name="project_memory_events")
-    op.drop_index("ix_project_memory_events_memory_id", table_name="project_memory_events")
     op.drop_table("project_memory_events")
-
-    op.drop_index("ix_project_memory_type_status_updated", table_name="project_memory_items")
-    op.drop_index("ix_project_memory_items_updated_by_user_id", table_name="project_memory_items")
-    op.drop_index("ix_project_memory_items_created_by_user_id", table_name="project_memory_items")
-    op.drop_index("ix_project_memory_items_article_id", table_name="project_memory_items")
-    op.drop_index("ix_project_memory_items_status", table_name="project_memory_items")
-    op.drop_index("ix_project_memory_items_memory_type", table_name="project_memory_items")
     op.drop_table("project_memory_items")
@@ -36,7 +36,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("run_id", name="uq_msi_runs_run_id"),
     )
-    op.create_index("ix_msi_runs_run_id", "msi_runs", ["run_id"], unique=True)
     op.create_index("ix_msi_runs_profile_id", "msi_runs", ["profile_id"], unique=False)
     op.create_index("ix_msi_runs_entity", "msi_runs", ["entity"], unique=False)
     op.create_index("ix_msi_runs_mode", "msi_runs", ["mode"], unique=False)
@@ -94,7 +93,7 @@ def upgrade() -> None:
 
     op.create_table(
         "msi_job_events",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("node", sa.String(length=64), nullable=False),
         sa.Column("event_type", sa.String(length=32), nullable=False),
@@ -183,5 +182,4 @@ def downgrade() -> None:
     op.drop_index("ix_msi_runs_mode", table_name="msi_runs")
     op.drop_index("ix_msi_runs_entity", table_name="msi_runs")
     op.drop_index("ix_msi_runs_profile_id", table_name="msi_runs")
-    op.drop_index("ix_msi_runs_run_id", table_name="msi_runs")
     op.drop_table("msi_runs")
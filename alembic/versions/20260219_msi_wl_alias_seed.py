@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 
 from alembic import op
+from psycopg2.extras import execute_values
 import sqlalchemy as sa
 
 
@@ -44,24 +45,25 @@ def upgrade() -> None:
         sa.Column("aliases_json", sa.JSON(), nullable=False, server_default=sa.text("'[]'::json")),
     )
 
+    # One multi-row INSERT instead of a per-row executemany round trip.
     bind = op.get_bind()
-    stmt = sa.text(
-        """
-        INSERT INTO msi_watchlist (
-            profile_id, entity, aliases_json, enabled, run_daily, run_weekly, created_by_username, created_at, updated_at
-        ) VALUES (
-            :profile_id, :entity, CAST(:aliases_json AS json), true, true, true, 'system_seed', now(), now()
+    with bind.connection.cursor() as cursor:
+        execute_values(
+            cursor,
+            """
+            INSERT INTO msi_watchlist (
+                profile_id, entity, aliases_json, enabled, run_daily, run_weekly, created_by_username, created_at, updated_at
+            ) VALUES %s
+            ON CONFLICT (profile_id, entity) DO UPDATE
+            SET aliases_json = EXCLUDED.aliases_json,
+                updated_at = now()
+            """,
+            [
+                (profile_id, entity, json.dumps(aliases, ensure_ascii=False))
+                for profile_id, entity, aliases in SEED_ROWS
+            ],
+            template="(%s, %s, CAST(%s AS json), true, true, true, 'system_seed', now(), now())",
         )
-        ON CONFLICT (profile_id, entity) DO UPDATE
-        SET aliases_json = EXCLUDED.aliases_json,
-            updated_at = now()
-        """
-    )
-    payload = [
-        {"profile_id": profile_id, "entity": entity, "aliases_json": json.dumps(aliases, ensure_ascii=False)}
-        for profile_id, entity, aliases in SEED_ROWS
-    ]
-    bind.execute(stmt, payload)
 
 
 def downgrade() -> None:
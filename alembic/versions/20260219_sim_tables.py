@@ -39,7 +39,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("run_id", name="uq_sim_runs_run_id"),
     )
-    op.create_index("ix_sim_runs_run_id", "sim_runs", ["run_id"], unique=True)
     op.create_index("ix_sim_runs_article_id", "sim_runs", ["article_id"], unique=False)
     op.create_index("ix_sim_runs_draft_id", "sim_runs", ["draft_id"], unique=False)
     op.create_index("ix_sim_runs_platform", "sim_runs", ["platform"], unique=False)
@@ -103,7 +102,7 @@ def upgrade() -> None:
 
     op.create_table(
         "sim_job_events",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("node", sa.String(length=64), nullable=False),
         sa.Column("event_type", sa.String(length=32), nullable=False),
@@ -151,5 +150,4 @@ def downgrade() -> None:
     op.drop_index("ix_sim_runs_platform", table_name="sim_runs")
     op.drop_index("ix_sim_runs_draft_id", table_name="sim_runs")
     op.drop_index("ix_sim_runs_article_id", table_name="sim_runs")
-    op.drop_index("ix_sim_runs_run_id", table_name="sim_runs")
     op.drop_table("sim_runs")
@@ -53,7 +53,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("run_id", name="uq_competitor_xray_runs_run_id"),
     )
-    op.create_index("ix_competitor_xray_runs_run_id", "competitor_xray_runs", ["run_id"], unique=True)
     op.create_index("ix_competitor_xray_runs_status", "competitor_xray_runs", ["status"], unique=False)
     op.create_index("ix_competitor_xray_runs_idempotency_key", "competitor_xray_runs", ["idempotency_key"], unique=False)
     op.create_index("ix_competitor_xray_runs_created_by_user_id", "competitor_xray_runs", ["created_by_user_id"], unique=False)
@@ -62,7 +61,7 @@ def upgrade() -> None:
 
     op.create_table(
         "competitor_xray_items",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("source_id", sa.Integer(), nullable=True),
         sa.Column("competitor_title", sa.String(length=1024), nullable=False),
@@ -96,7 +95,7 @@ def upgrade() -> None:
 
     op.create_table(
         "competitor_xray_events",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("node", sa.String(length=64), nullable=False),
         sa.Column("event_type", sa.String(length=32), nullable=False),
@@ -137,7 +136,6 @@ def downgrade() -> None:
     op.drop_index("ix_competitor_xray_runs_created_by_user_id", table_name="competitor_xray_runs")
     op.drop_index("ix_competitor_xray_runs_idempotency_key", table_name="competitor_xray_runs")
     op.drop_index("ix_competitor_xray_runs_status", table_name="competitor_xray_runs")
-    op.drop_index("ix_competitor_xray_runs_run_id", table_name="competitor_xray_runs")
     op.drop_table("competitor_xray_runs")
 
     op.drop_index("ix_competitor_xray_sources_updated_at", table_name="competitor_xray_sources")
@@ -40,7 +40,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("run_id", name="uq_media_logger_runs_run_id"),
     )
-    op.create_index("ix_media_logger_runs_run_id", "media_logger_runs", ["run_id"], unique=True)
     op.create_index("ix_media_logger_runs_source_type", "media_logger_runs", ["source_type"], unique=False)
     op.create_index("ix_media_logger_runs_status", "media_logger_runs", ["status"], unique=False)
     op.create_index("ix_media_logger_runs_idempotency_key", "media_logger_runs", ["idempotency_key"], unique=False)
@@ -50,7 +49,7 @@ def upgrade() -> None:
 
     op.create_table(
         "media_logger_segments",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("segment_index", sa.Integer(), nullable=False),
         sa.Column("start_sec", sa.Float(), nullable=False),
@@ -88,7 +87,7 @@ def upgrade() -> None:
 
     op.create_table(
         "media_logger_job_events",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("node", sa.String(length=64), nullable=False),
         sa.Column("event_type", sa.String(length=32), nullable=False),
@@ -130,5 +129,4 @@ def downgrade() -> None:
     op.drop_index("ix_media_logger_runs_idempotency_key", table_name="media_logger_runs")
     op.drop_index("ix_media_logger_runs_status", table_name="media_logger_runs")
     op.drop_index("ix_media_logger_runs_source_type", table_name="media_logger_runs")
-    op.drop_index("ix_media_logger_runs_run_id", table_name="media_logger_runs")
     op.drop_table("media_logger_runs")
@@ -38,7 +38,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("url", name="uq_link_index_items_url"),
     )
-    op.create_index("ix_link_index_items_url", "link_index_items", ["url"], unique=True)
     op.create_index("ix_link_index_items_domain", "link_index_items", ["domain"], unique=False)
     op.create_index("ix_link_index_items_link_type", "link_index_items", ["link_type"], unique=False)
     op.create_index("ix_link_index_items_category", "link_index_items", ["category"], unique=False)
@@ -70,7 +69,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("domain", name="uq_trusted_domains_domain"),
     )
-    op.create_index("ix_trusted_domains_domain", "trusted_domains", ["domain"], unique=True)
     op.create_index("ix_trusted_domains_tier", "trusted_domains", ["tier"], unique=False)
     op.create_index("ix_trusted_domains_enabled", "trusted_domains", ["enabled"], unique=False)
     op.create_index("ix_trusted_domains_created_at", "trusted_domains", ["created_at"], unique=False)
@@ -99,10 +97,6 @@ def upgrade() -> None:
     )
     op.create_index("ix_link_recommendation_runs_run_id", "link_recommendation_runs", ["run_id"], unique=True)
     op.create_index("ix_link_recommendation_runs_work_id", "link_recommendation_runs", ["work_id"], unique=False)
-    op.create_index("ix_link_recommendation_runs_article_id", "link_recommendation_runs", ["article_id"], unique=False)
-    op.create_index("ix_link_recommendation_runs_draft_id", "link_recommendation_runs", ["draft_id"], unique=False)
-    op.create_index("ix_link_recommendation_runs_mode", "link_recommendation_runs", ["mode"], unique=False)
-    op.create_index("ix_link_recommendation_runs_status", "link_recommendation_runs", ["status"], unique=False)
     op.create_index(
         "ix_link_recommend_runs_work_created",
         "link_recommendation_runs",
@@ -112,7 +106,7 @@ def upgrade() -> None:
 
     op.create_table(
         "link_recommendation_items",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("run_id", sa.String(length=64), nullable=False),
         sa.Column("link_index_item_id", sa.Integer(), nullable=True),
         sa.Column("link_type", sa.String(length=16), nullable=False),
@@ -146,7 +140,7 @@ def upgrade() -> None:
 
     op.create_table(
         "link_click_events",
-        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
         sa.Column("article_id", sa.Integer(), nullable=True),
         sa.Column("work_id", sa.String(length=64), nullable=True),
         sa.Column("url", sa.String(length=2048), nullable=False),
@@ -203,10 +197,6 @@ def downgrade() -> None:
     op.drop_table("link_recommendation_items")
 
     op.drop_index("ix_link_recommend_runs_work_created", table_name="link_recommendation_runs")
-    op.drop_index("ix_link_recommendation_runs_status", table_name="link_recommendation_runs")
-    op.drop_index("ix_link_recommendation_runs_mode", table_name="link_recommendation_runs")
-    op.drop_index("ix_link_recommendation_runs_draft_id", table_name="link_recommendation_runs")
-    op.drop_index("ix_link_recommendation_runs_article_id", table_name="link_recommendation_runs")
     op.drop_index("ix_link_recommendation_runs_work_id", table_name="link_recommendation_runs")
     op.drop_index("ix_link_recommendation_runs_run_id", table_name="link_recommendation_runs")
     op.drop_table("link_recommendation_runs")
@@ -215,7 +205,6 @@ def downgrade() -> None:
     op.drop_index("ix_trusted_domains_created_at", table_name="trusted_domains")
     op.drop_index("ix_trusted_domains_enabled", table_name="trusted_domains")
     op.drop_index("ix_trusted_domains_tier", table_name="trusted_domains")
-    op.drop_index("ix_trusted_domains_domain", table_name="trusted_domains")
     op.drop_table("trusted_domains")
 
     op.drop_index("ix_link_index_type_active_recent", table_name="link_index_items")
@@ -228,6 +217,5 @@ def downgrade() -> None:
     op.drop_index("ix_link_index_items_category", table_name="link_index_items")
     op.drop_index("ix_link_index_items_link_type", table_name="link_index_items")
     op.drop_index("ix_link_index_items_domain", table_name="link_index_items")
-    op.drop_index("ix_link_index_items_url", table_name="link_index_items")
     op.drop_table("link_index_items")
 
@@ -0,0 +1,87 @@
+"""serve action_audit_logs reads from an (action, created_at) index
+
+Revision ID: 20261017_action_audit_indexes
+Revises: 20261017_link_url_columns
+Create Date: 2026-10-17 16:50:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_action_audit_indexes"
+down_revision = "20261017_link_url_columns"
+branch_labels = None
+depends_on = None
+
+
+# Leading columns of ix_action_audit_action_created / ix_action_audit_entity_created.
+PREFIX_COVERED_INDEXES = [
+    ("ix_action_audit_action", "action"),
+    ("ix_action_audit_entity_type", "entity_type"),
+]
+
+
+def upgrade() -> None:
+    # Every read filters on one action and walks created_at newest first (the UX
+    # telemetry feed and summary, the auto-archive recovery scan), so a composite index
+    # answers them in order with the LIMIT. The log is append-only, so created_at
+    # follows the heap order and a BRIN summary is enough for bare time-range scans.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_action_audit_action_created",
+            "action_audit_logs",
+            ["action", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _ in PREFIX_COVERED_INDEXES:
+            op.drop_index(name, table_name="action_audit_logs", postgresql_concurrently=True, if_exists=True)
+        brin = "ix_action_audit_created_at_brin"
+        drop_invalid_indexes([brin])
+        op.create_index(
+            brin,
+            "action_audit_logs",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_action_audit_created_at",
+            table_name="action_audit_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER INDEX ix_action_audit_created_at_brin RENAME TO ix_action_audit_created_at")
+
+
+def downgrade() -> None:
+    op.execute("ALTER INDEX IF EXISTS ix_action_audit_created_at RENAME TO ix_action_audit_created_at_brin")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_action_audit_created_at",
+            "action_audit_logs",
+            ["created_at"],
+            postgresql_using="btree",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_action_audit_created_at_brin",
+            table_name="action_audit_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        for name, column in reversed(PREFIX_COVERED_INDEXES):
+            op.create_index(name, "action_audit_logs", [column], postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index(
+            "ix_action_audit_action_created",
+            table_name="action_audit_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
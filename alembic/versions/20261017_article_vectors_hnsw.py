@@ -0,0 +1,60 @@
+"""switch article_vectors ANN index to HNSW over halfvec
+
+Revision ID: 20261017_article_vectors_hnsw
+Revises: 20260317_document_intel_workspace
+Create Date: 2026-10-17 09:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes, pgvector_version
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_article_vectors_hnsw"
+down_revision = "20260317_document_intel_workspace"
+branch_labels = None
+depends_on = None
+
+
+INDEX = "ix_article_vectors_embedding_half_hnsw"
+
+
+def _ivfflat_lists() -> int:
+    # pgvector's guidance for a populated table: rows/1000 up to 1M rows, sqrt(rows)
+    # beyond, never below 100. Recall is tuned at query time via `SET ivfflat.probes`.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'article_vectors'")).scalar()
+    rows = max(int(rows or 0), 1)
+    return max(100, rows // 1000 if rows <= 1_000_000 else round(rows**0.5))
+
+
+def upgrade() -> None:
+    # HNSW builds incrementally and keeps recall as the table grows, so the streaming
+    # article ingest no longer needs periodic ivfflat rebuilds. It is built over
+    # `embedding::halfvec(256)` (FP16, 512 B/row instead of 1 KB), halving index size and
+    # probe bandwidth; the FP32 column is kept as-is and similarity queries order by the
+    # same expression (ArticleVector.embedding_half).
+    if pgvector_version() < (0, 7):
+        raise RuntimeError("article vector search requires pgvector >= 0.7; run ALTER EXTENSION vector UPDATE first")
+
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes([INDEX])
+        op.execute("SET maintenance_work_mem = '1GB'")
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX} "
+            "ON article_vectors USING hnsw ((embedding::halfvec(256)) halfvec_cosine_ops) "
+            "WITH (m = 16, ef_construction = 64)"
+        )
+        op.execute("RESET maintenance_work_mem")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_article_vectors_embedding_ivfflat")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_article_vectors_embedding_ivfflat "
+            f"ON article_vectors USING ivfflat (embedding vector_cosine_ops) WITH (lists = {_ivfflat_lists()})"
+        )
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX}")
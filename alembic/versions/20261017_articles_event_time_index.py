@@ -0,0 +1,51 @@
+"""index articles by coalesce(published_at, crawled_at)
+
+Revision ID: 20261017_articles_event_time
+Revises: 20261017_knowledge_prefix_indexes
+Create Date: 2026-10-17 09:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_articles_event_time"
+down_revision = "20261017_knowledge_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+
+INDEX = "ix_articles_published_or_crawled_at"
+
+
+def upgrade() -> None:
+    # The freshness and breaking feeds, the stale-article sweeps, the scout duplicate
+    # window and the related-articles ordering all filter or sort on
+    # coalesce(published_at, crawled_at); nothing reads published_at alone, so the plain
+    # btree on it is replaced by one on the expression. published_at comes from the feeds
+    # and archive backfills and does not follow insert order, so this stays a btree.
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes([INDEX])
+        op.create_index(
+            INDEX,
+            "articles",
+            [sa.text("coalesce(published_at, crawled_at)")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_articles_published_at", table_name="articles", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_published_at",
+            "articles",
+            ["published_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(INDEX, table_name="articles", postgresql_concurrently=True, if_exists=True)
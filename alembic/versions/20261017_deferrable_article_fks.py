@@ -0,0 +1,51 @@
+"""make articles.id foreign keys on knowledge tables deferrable
+
+Revision ID: 20261017_deferrable_article_fks
+Revises: 20261017_drop_chunks_article_idx
+Create Date: 2026-10-17 10:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_deferrable_article_fks"
+down_revision = "20261017_drop_chunks_article_idx"
+branch_labels = None
+depends_on = None
+
+
+TABLES = [
+    "article_topics",
+    "article_entities",
+    "article_chunks",
+    "article_vectors",
+    "story_cluster_members",
+    "article_fingerprints",
+    "article_relations",
+]
+
+
+def _article_fk_names() -> list[tuple[str, str]]:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    names = []
+    for table in TABLES:
+        for fk in inspector.get_foreign_keys(table):
+            if fk["referred_table"] == "articles" and fk.get("name"):
+                names.append((table, fk["name"]))
+    return names
+
+
+def upgrade() -> None:
+    # DEFERRABLE INITIALLY IMMEDIATE keeps today's behaviour (checked per statement);
+    # bulk loaders can opt in with `SET CONSTRAINTS ALL DEFERRED` and have the checks
+    # run once at COMMIT, in any insert order. Metadata-only, no revalidation.
+    for table, name in _article_fk_names():
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {name} DEFERRABLE INITIALLY IMMEDIATE")
+
+
+def downgrade() -> None:
+    for table, name in _article_fk_names():
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {name} NOT DEFERRABLE")
@@ -0,0 +1,51 @@
+"""make MSI/simulator run_id foreign keys deferrable
+
+Revision ID: 20261017_deferrable_run_fks
+Revises: 20261017_drop_run_id_dup_idx
+Create Date: 2026-10-17 13:10:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_deferrable_run_fks"
+down_revision = "20261017_drop_run_id_dup_idx"
+branch_labels = None
+depends_on = None
+
+
+# child table -> run table
+TABLES = {
+    "msi_reports": "msi_runs",
+    "msi_artifacts": "msi_runs",
+    "msi_job_events": "msi_runs",
+    "sim_results": "sim_runs",
+    "sim_feedback": "sim_runs",
+    "sim_job_events": "sim_runs",
+}
+
+
+def _run_fk_names() -> list[tuple[str, str]]:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    names = []
+    for table, run_table in TABLES.items():
+        for fk in inspector.get_foreign_keys(table):
+            if fk["referred_table"] == run_table and fk.get("name"):
+                names.append((table, fk["name"]))
+    return names
+
+
+def upgrade() -> None:
+    # Same treatment as the knowledge-table article FKs: checks stay per statement by
+    # default, and bulk loaders/backfills can `SET CONSTRAINTS ALL DEFERRED` to check
+    # once at COMMIT. Metadata-only, no revalidation.
+    for table, name in _run_fk_names():
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {name} DEFERRABLE INITIALLY IMMEDIATE")
+
+
+def downgrade() -> None:
+    for table, name in _run_fk_names():
+        op.execute(f"ALTER TABLE {table} ALTER CONSTRAINT {name} NOT DEFERRABLE")
@@ -0,0 +1,39 @@
+"""drop ix_article_chunks_article_idx (duplicate of the unique constraint)
+
+Revision ID: 20261017_drop_chunks_article_idx
+Revises: 20261017_text_lz4_compression
+Create Date: 2026-10-17 10:20:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_drop_chunks_article_idx"
+down_revision = "20261017_text_lz4_compression"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_article_chunks_article_chunk already maintains a btree on (article_id, chunk_index).
+    # The surrogate `id` stays as primary key: article_vectors.chunk_id references it.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_article_chunks_article_idx",
+            table_name="article_chunks",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_article_chunks_article_idx",
+            "article_chunks",
+            ["article_id", "chunk_index"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
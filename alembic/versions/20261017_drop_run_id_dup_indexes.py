@@ -0,0 +1,36 @@
+"""drop run_id unique indexes duplicated by unique constraints
+
+Revision ID: 20261017_drop_run_id_dup_idx
+Revises: 20261017_msi_sim_hash_indexes
+Create Date: 2026-10-17 13:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_drop_run_id_dup_idx"
+down_revision = "20261017_msi_sim_hash_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, duplicated by)
+DUPLICATE_INDEXES = [
+    ("ix_msi_runs_run_id", "msi_runs", "uq_msi_runs_run_id"),
+    ("ix_sim_runs_run_id", "sim_runs", "uq_sim_runs_run_id"),
+]
+
+
+def upgrade() -> None:
+    # The uq_* constraints already own a unique btree on run_id, and the child-table
+    # foreign keys are bound to those, so the ix_* twins only double insert cost.
+    with op.get_context().autocommit_block():
+        for name, table, _duplicated_by in DUPLICATE_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _duplicated_by in reversed(DUPLICATE_INDEXES):
+            op.create_index(name, table, ["run_id"], unique=True, postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,39 @@
+"""drop the duplicate trusted_domains domain index
+
+Revision ID: 20261017_drop_trusted_domain_idx
+Revises: 20261017_action_audit_indexes
+Create Date: 2026-10-17 17:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_drop_trusted_domain_idx"
+down_revision = "20261017_action_audit_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # uq_trusted_domains_domain already owns a unique btree on domain; fresh installs no
+    # longer build this twin in 20260222_link_intelligence_tables.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_trusted_domains_domain",
+            table_name="trusted_domains",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_trusted_domains_domain",
+            "trusted_domains",
+            ["domain"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
@@ -0,0 +1,38 @@
+"""drop the unused competitor_xray_items competitor_url index
+
+Revision ID: 20261017_drop_xray_items_url_idx
+Revises: 20261017_xray_sources_partial
+Create Date: 2026-10-17 14:20:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_drop_xray_items_url_idx"
+down_revision = "20261017_xray_sources_partial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Items are listed by priority and fetched by id; nothing looks an item up by its
+    # URL, and the full-URL btree is the widest index on the table.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_competitor_xray_items_competitor_url",
+            table_name="competitor_xray_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_competitor_xray_items_competitor_url",
+            "competitor_xray_items",
+            ["competitor_url"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
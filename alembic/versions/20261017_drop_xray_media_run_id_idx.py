@@ -0,0 +1,37 @@
+"""drop competitor_xray/media_logger run_id indexes duplicated by unique constraints
+
+Revision ID: 20261017_xray_media_run_id_idx
+Revises: 20261017_xray_media_fillfactor
+Create Date: 2026-10-17 15:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_media_run_id_idx"
+down_revision = "20261017_xray_media_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, duplicated by)
+DUPLICATE_INDEXES = [
+    ("ix_competitor_xray_runs_run_id", "competitor_xray_runs", "uq_competitor_xray_runs_run_id"),
+    ("ix_media_logger_runs_run_id", "media_logger_runs", "uq_media_logger_runs_run_id"),
+]
+
+
+def upgrade() -> None:
+    # Fresh installs no longer build these in 20260221_*_tables; this clears them from
+    # databases created before that. The child-table foreign keys are bound to the uq_*
+    # constraint indexes.
+    with op.get_context().autocommit_block():
+        for name, table, _duplicated_by in DUPLICATE_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _duplicated_by in reversed(DUPLICATE_INDEXES):
+            op.create_index(name, table, ["run_id"], unique=True, postgresql_concurrently=True, if_not_exists=True)
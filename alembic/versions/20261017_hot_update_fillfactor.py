@@ -0,0 +1,36 @@
+"""lower fillfactor on in-place updated tables
+
+Revision ID: 20261017_hot_update_fillfactor
+Revises: 20261017_deferrable_article_fks
+Create Date: 2026-10-17 10:40:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_hot_update_fillfactor"
+down_revision = "20261017_deferrable_article_fks"
+branch_labels = None
+depends_on = None
+
+
+FILLFACTORS = {
+    "api_settings": 90,
+    "editorial_drafts": 90,
+    "article_profiles": 90,
+    "article_fingerprints": 85,
+}
+
+
+def upgrade() -> None:
+    # Free space on each heap page lets updates of non-indexed columns (updated_at,
+    # value, metadata_json, shingles) stay HOT and skip index maintenance. Applies to
+    # pages written from now on; existing pages pick it up as they are rewritten.
+    for table, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+
+def downgrade() -> None:
+    for table in FILLFACTORS:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,50 @@
+"""store knowledge JSON columns as JSONB
+
+Revision ID: 20261017_knowledge_jsonb
+Revises: 20261017_timestamp_defaults
+Create Date: 2026-10-17 09:50:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_knowledge_jsonb"
+down_revision = "20261017_timestamp_defaults"
+branch_labels = None
+depends_on = None
+
+
+JSON_COLUMNS = [
+    ("article_profiles", "metadata_json"),
+    ("article_fingerprints", "shingles"),
+    ("article_relations", "metadata_json"),
+]
+
+
+def upgrade() -> None:
+    # infographics.data_json stays Text: it is an opaque json.dumps payload that is
+    # never filtered on.
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::jsonb",
+        )
+
+
+def downgrade() -> None:
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table,
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            existing_nullable=True,
+            postgresql_using=f"{column}::json",
+        )
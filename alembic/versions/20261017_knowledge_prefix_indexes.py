@@ -0,0 +1,54 @@
+"""drop knowledge indexes covered by composite indexes or unique constraints
+
+Revision ID: 20261017_knowledge_prefix_indexes
+Revises: 20261017_article_vectors_hnsw
+Create Date: 2026-10-17 09:20:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_knowledge_prefix_indexes"
+down_revision = "20261017_article_vectors_hnsw"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, unique, covered by)
+REDUNDANT_INDEXES = [
+    ("ix_article_profiles_article_id", "article_profiles", ["article_id"], True, "uq_article_profiles_article_id"),
+    ("ix_article_profiles_archive_code", "article_profiles", ["archive_code"], True, "uq_article_profiles_archive_code"),
+    ("ix_article_profiles_category", "article_profiles", ["category"], False, "ix_article_profiles_category_status"),
+    ("ix_article_topics_article_id", "article_topics", ["article_id"], False, "uq_article_topics_article_topic"),
+    ("ix_article_entities_article_id", "article_entities", ["article_id"], False, "uq_article_entities_article_entity_type"),
+    ("ix_article_chunks_article_id", "article_chunks", ["article_id"], False, "uq_article_chunks_article_chunk"),
+    ("ix_article_vectors_article_id", "article_vectors", ["article_id"], False, "ix_article_vectors_article_type"),
+    ("ix_story_clusters_cluster_key", "story_clusters", ["cluster_key"], True, "uq_story_clusters_cluster_key"),
+    ("ix_story_cluster_members_cluster_id", "story_cluster_members", ["cluster_id"], False, "uq_story_cluster_member"),
+    ("ix_story_cluster_members_article_id", "story_cluster_members", ["article_id"], False, "uq_story_cluster_member_article"),
+    ("ix_article_fingerprints_article_id", "article_fingerprints", ["article_id"], True, "uq_article_fingerprints_article_id"),
+    ("ix_article_relations_from_article_id", "article_relations", ["from_article_id"], False, "ix_article_relations_from_type"),
+]
+
+
+def upgrade() -> None:
+    # Each of these is identical to, or a leading-column prefix of, the index named in
+    # REDUNDANT_INDEXES, so lookups are already served there; dropping them saves one
+    # btree write per insert on the ingest path.
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _unique, _covered_by in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique, _covered_by in reversed(REDUNDANT_INDEXES):
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=unique,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
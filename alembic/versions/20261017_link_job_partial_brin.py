@@ -0,0 +1,90 @@
+"""narrow link recommendation, job queue and click event time/score indexes
+
+Revision ID: 20261017_link_job_partial_brin
+Revises: 20261017_link_job_prefix_idx
+Create Date: 2026-10-17 16:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_link_job_partial_brin"
+down_revision = "20261017_link_job_prefix_idx"
+branch_labels = None
+depends_on = None
+
+
+PENDING_PREDICATE = "status IN ('queued', 'running')"
+
+
+def upgrade() -> None:
+    # Recommendation items are only ever ranked by score within one run, which
+    # ix_link_recommend_items_run_score serves; the table-wide score index was unused.
+    # The stale-job sweeps and find_active_job only look at queued/running jobs by
+    # queued_at; the partial index holds just those. ix_job_runs_queued_at stays for the
+    # unfiltered job listing, which reads it in order with a LIMIT. Click events are
+    # append-only, so created_at follows the heap order and a BRIN summary suffices.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_link_recommendation_items_score",
+            table_name="link_recommendation_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_job_runs_queued_at_pending",
+            "job_runs",
+            ["queued_at"],
+            postgresql_where=sa.text(PENDING_PREDICATE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        brin = "ix_link_click_events_created_at_brin"
+        drop_invalid_indexes([brin])
+        op.create_index(
+            brin,
+            "link_click_events",
+            ["created_at"],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_link_click_events_created_at",
+            table_name="link_click_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute("ALTER INDEX ix_link_click_events_created_at_brin RENAME TO ix_link_click_events_created_at")
+
+
+def downgrade() -> None:
+    op.execute("ALTER INDEX IF EXISTS ix_link_click_events_created_at RENAME TO ix_link_click_events_created_at_brin")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_link_click_events_created_at",
+            "link_click_events",
+            ["created_at"],
+            postgresql_using="btree",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_link_click_events_created_at_brin",
+            table_name="link_click_events",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index("ix_job_runs_queued_at_pending", table_name="job_runs", postgresql_concurrently=True, if_exists=True)
+        op.create_index(
+            "ix_link_recommendation_items_score",
+            "link_recommendation_items",
+            ["score"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
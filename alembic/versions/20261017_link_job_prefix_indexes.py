@@ -0,0 +1,51 @@
+"""drop link intelligence/job queue/script indexes covered by composite indexes
+
+Revision ID: 20261017_link_job_prefix_idx
+Revises: 20261017_xray_timestamp_idx
+Create Date: 2026-10-17 15:50:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_link_job_prefix_idx"
+down_revision = "20261017_xray_timestamp_idx"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, covered by)
+REDUNDANT_INDEXES = [
+    ("ix_link_index_items_link_type", "link_index_items", ["link_type"], "ix_link_index_type_active_recent"),
+    (
+        "ix_link_recommendation_runs_work_id",
+        "link_recommendation_runs",
+        ["work_id"],
+        "ix_link_recommend_runs_work_created",
+    ),
+    (
+        "ix_link_recommendation_items_run_id",
+        "link_recommendation_items",
+        ["run_id"],
+        "ix_link_recommend_items_run_score",
+    ),
+    ("ix_job_runs_queue_name", "job_runs", ["queue_name"], "ix_job_runs_queue_status"),
+    ("ix_job_runs_job_type", "job_runs", ["job_type"], "ix_job_runs_type_queued"),
+    ("ix_script_projects_type", "script_projects", ["type"], "ix_script_projects_type_status"),
+    ("ix_script_outputs_script_id", "script_outputs", ["script_id"], "ix_script_outputs_script_created"),
+]
+
+
+def upgrade() -> None:
+    # Each column is the leading column of the covering composite, which serves the
+    # same equality predicates (and the ON DELETE CASCADE lookups on run_id/script_id).
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _covered_by in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, _covered_by in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
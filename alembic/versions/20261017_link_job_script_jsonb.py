@@ -0,0 +1,55 @@
+"""store link intelligence, job queue and script studio JSON columns as JSONB
+
+Revision ID: 20261017_link_job_script_jsonb
+Revises: 20261017_link_job_partial_brin
+Create Date: 2026-10-17 16:10:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_link_job_script_jsonb"
+down_revision = "20261017_link_job_partial_brin"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default literal or None)
+JSON_COLUMNS = [
+    ("link_index_items", "keywords_json", "'[]'"),
+    ("link_index_items", "metadata_json", "'{}'"),
+    ("link_recommendation_runs", "source_counts_json", "'{}'"),
+    ("link_recommendation_items", "metadata_json", "'{}'"),
+    ("job_runs", "payload_json", "'{}'"),
+    ("job_runs", "result_json", None),
+    ("dead_letter_jobs", "payload_json", "'{}'"),
+    ("dead_letter_jobs", "meta_json", "'{}'"),
+    ("script_projects", "params_json", "'{}'"),
+    ("script_outputs", "content_json", None),
+    ("script_outputs", "quality_issues_json", "'[]'"),
+]
+
+
+def _retype(target: str) -> None:
+    actions: dict[str, list[str]] = {}
+    for table, column, default in JSON_COLUMNS:
+        table_actions = actions.setdefault(table, [])
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} DROP DEFAULT")
+        table_actions.append(f"ALTER COLUMN {column} TYPE {target} USING {column}::{target}")
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} SET DEFAULT {default}::{target}")
+    # One statement per table: each table, job_runs included, is rewritten once.
+    for table, table_actions in actions.items():
+        op.execute(f"ALTER TABLE {table} {', '.join(table_actions)}")
+
+
+def upgrade() -> None:
+    # Not indexed: every column is read back whole with its row (job payloads by job
+    # id, keywords by the in-process link scorer); nothing filters on keys.
+    _retype("jsonb")
+
+
+def downgrade() -> None:
+    _retype("json")
@@ -0,0 +1,45 @@
+"""drop unused link_recommendation_runs indexes
+
+Revision ID: 20261017_link_runs_unused_idx
+Revises: 20261017_link_job_script_jsonb
+Create Date: 2026-10-17 16:30:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_link_runs_unused_idx"
+down_revision = "20261017_link_job_script_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# (index, column)
+UNUSED_INDEXES = [
+    ("ix_link_recommendation_runs_article_id", "article_id"),
+    ("ix_link_recommendation_runs_draft_id", "draft_id"),
+    ("ix_link_recommendation_runs_mode", "mode"),
+    ("ix_link_recommendation_runs_status", "status"),
+]
+
+
+def upgrade() -> None:
+    # Fresh installs no longer build these in 20260222_link_intelligence_tables. Runs
+    # are read by run_id or by work_id; no query filters on these columns, and articles
+    # and drafts are never deleted, so the FK columns need no index for delete checks.
+    with op.get_context().autocommit_block():
+        for name, _column in UNUSED_INDEXES:
+            op.drop_index(name, table_name="link_recommendation_runs", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in reversed(UNUSED_INDEXES):
+            op.create_index(
+                name,
+                "link_recommendation_runs",
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
@@ -0,0 +1,50 @@
+"""store link URLs as text and drop the duplicate link_index_items url index
+
+Revision ID: 20261017_link_url_columns
+Revises: 20261017_link_runs_unused_idx
+Create Date: 2026-10-17 16:40:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_link_url_columns"
+down_revision = "20261017_link_runs_unused_idx"
+branch_labels = None
+depends_on = None
+
+
+URL_TABLES = ["link_index_items", "link_recommendation_items", "link_click_events"]
+
+
+def upgrade() -> None:
+    # varchar(2048) -> text is binary-compatible: catalog-only, no rewrite or reindex.
+    for table in URL_TABLES:
+        op.alter_column(table, "url", type_=sa.Text(), existing_type=sa.String(length=2048))
+
+    # uq_link_index_items_url already owns a unique btree on url; fresh installs no
+    # longer build this twin in 20260222_link_intelligence_tables.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_link_index_items_url",
+            table_name="link_index_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_link_index_items_url",
+            "link_index_items",
+            ["url"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    for table in URL_TABLES:
+        op.alter_column(table, "url", type_=sa.String(length=2048), existing_type=sa.Text())
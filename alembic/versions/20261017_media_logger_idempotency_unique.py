@@ -0,0 +1,70 @@
+"""make live media_logger idempotency keys unique
+
+Revision ID: 20261017_media_logger_idem_uq
+Revises: 20261017_xray_media_run_id_idx
+Create Date: 2026-10-17 15:10:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_media_logger_idem_uq"
+down_revision = "20261017_xray_media_run_id_idx"
+branch_labels = None
+depends_on = None
+
+
+INDEX = "ix_media_logger_runs_idempotency_key"
+PREDICATE = "idempotency_key IS NOT NULL AND status <> 'failed'"
+
+
+def upgrade() -> None:
+    # A key is reused only once its run has failed, so it is unique among the other
+    # runs. Older duplicates left by concurrent submissions keep their rows but give
+    # the key up to the newest run, which is the one the service already returns.
+    op.execute(
+        f"""
+        UPDATE media_logger_runs r
+        SET idempotency_key = NULL
+        FROM (
+            SELECT
+                id,
+                ROW_NUMBER() OVER (PARTITION BY idempotency_key ORDER BY created_at DESC, id DESC) AS rn
+            FROM media_logger_runs
+            WHERE {PREDICATE}
+        ) ranked
+        WHERE r.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        # Also catches a build failed by a duplicate written after the dedup above.
+        drop_invalid_indexes([f"{INDEX}_uq"])
+        op.create_index(
+            f"{INDEX}_uq",
+            "media_logger_runs",
+            ["idempotency_key"],
+            unique=True,
+            postgresql_where=sa.text(PREDICATE),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(INDEX, table_name="media_logger_runs", postgresql_concurrently=True, if_exists=True)
+    op.execute(f"ALTER INDEX {INDEX}_uq RENAME TO {INDEX}")
+
+
+def downgrade() -> None:
+    op.execute(f"ALTER INDEX IF EXISTS {INDEX} RENAME TO {INDEX}_uq")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX,
+            "media_logger_runs",
+            ["idempotency_key"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(f"{INDEX}_uq", table_name="media_logger_runs", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,85 @@
+"""cover the media_logger recent-runs listing with the status index
+
+Revision ID: 20261017_media_runs_covering
+Revises: 20261017_xray_items_status_prio
+Create Date: 2026-10-17 15:30:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_media_runs_covering"
+down_revision = "20261017_xray_items_status_prio"
+branch_labels = None
+depends_on = None
+
+
+LISTING_COLUMNS = [
+    "run_id",
+    "source_type",
+    "source_label",
+    "language_hint",
+    "segments_count",
+    "highlights_count",
+    "finished_at",
+]
+
+
+def upgrade() -> None:
+    # The recent-runs listing filtered by status returns only these columns. They are
+    # written together with status when a run finishes, so carrying them costs no HOT
+    # updates that the status key did not already cost. The single-column status index
+    # is a prefix of this one.
+    with op.get_context().autocommit_block():
+        covering = "ix_media_logger_runs_status_created_covering"
+        drop_invalid_indexes([covering])
+        op.create_index(
+            covering,
+            "media_logger_runs",
+            ["status", sa.text("created_at DESC")],
+            postgresql_include=LISTING_COLUMNS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_media_logger_runs_status_created",
+            table_name="media_logger_runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index("ix_media_logger_runs_status", table_name="media_logger_runs", postgresql_concurrently=True, if_exists=True)
+    op.execute(
+        "ALTER INDEX ix_media_logger_runs_status_created_covering RENAME TO ix_media_logger_runs_status_created"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER INDEX IF EXISTS ix_media_logger_runs_status_created "
+        "RENAME TO ix_media_logger_runs_status_created_covering"
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_media_logger_runs_status",
+            "media_logger_runs",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_media_logger_runs_status_created",
+            "media_logger_runs",
+            ["status", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_media_logger_runs_status_created_covering",
+            table_name="media_logger_runs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
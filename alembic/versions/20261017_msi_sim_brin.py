@@ -0,0 +1,65 @@
+"""use BRIN for append-only MSI/simulator timestamps
+
+Revision ID: 20261017_msi_sim_brin
+Revises: 20261017_msi_wl_partial_indexes
+Create Date: 2026-10-17 12:00:00
+"""
+
+from alembic import op
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_brin"
+down_revision = "20261017_msi_wl_partial_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column)
+BRIN_INDEXES = [
+    ("ix_msi_runs_created_at", "msi_runs", "created_at"),
+    ("ix_msi_reports_created_at", "msi_reports", "created_at"),
+    ("ix_msi_job_events_ts", "msi_job_events", "ts"),
+    ("ix_sim_job_events_ts", "sim_job_events", "ts"),
+]
+
+
+def upgrade() -> None:
+    # These columns are only ever set at insert time, so they follow the heap order and
+    # a BRIN summary covers any range filter. Point lookups go through run_id (and the
+    # (run_id, ts) btrees on the event tables). ix_sim_runs_created_at stays a btree
+    # because the "latest runs" listing reads it in index order with a LIMIT, and
+    # sim_calibration.updated_at is rewritten in place, so it has no heap correlation.
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes([f"{name}_brin" for name, _table, _column in BRIN_INDEXES])
+        for name, table, column in BRIN_INDEXES:
+            op.create_index(
+                f"{name}_brin",
+                table,
+                [column],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    for name, _table, _column in BRIN_INDEXES:
+        op.execute(f"ALTER INDEX {name}_brin RENAME TO {name}")
+
+
+def downgrade() -> None:
+    for name, _table, _column in BRIN_INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_brin")
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(BRIN_INDEXES):
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="btree",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(f"{name}_brin", table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,95 @@
+"""store bounded MSI/simulator vocabulary columns as native enums
+
+Revision ID: 20261017_msi_sim_enums
+Revises: 20261017_msi_sim_jsonb
+Create Date: 2026-10-17 11:40:00
+"""
+
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_enums"
+down_revision = "20261017_msi_sim_jsonb"
+branch_labels = None
+depends_on = None
+
+
+ENUM_TYPES = {
+    "msi_mode": ("daily", "weekly"),
+    "msi_run_status": ("queued", "running", "completed", "failed"),
+    "msi_level": ("GREEN", "YELLOW", "ORANGE", "RED"),
+    "msi_event_type": ("started", "finished", "failed", "state_update"),
+    "sim_platform": ("facebook", "x"),
+    "sim_mode": ("fast", "deep"),
+    "sim_run_status": ("queued", "running", "completed", "failed"),
+    "sim_event_type": ("started", "finished", "failed", "state_update"),
+    "sim_feedback_action": ("accept", "edit", "ignore"),
+}
+
+# (table, column, enum type, previous varchar length, server default or None)
+ENUM_COLUMNS = [
+    ("msi_runs", "mode", "msi_mode", 16, None),
+    ("msi_runs", "status", "msi_run_status", 24, "queued"),
+    ("msi_timeseries", "mode", "msi_mode", 16, None),
+    ("msi_timeseries", "level", "msi_level", 16, None),
+    ("msi_job_events", "event_type", "msi_event_type", 32, None),
+    ("sim_runs", "platform", "sim_platform", 16, "facebook"),
+    ("sim_runs", "mode", "sim_mode", 16, "fast"),
+    ("sim_runs", "status", "sim_run_status", 24, "queued"),
+    ("sim_job_events", "event_type", "sim_event_type", 32, None),
+    ("sim_feedback", "action", "sim_feedback_action", 32, None),
+    ("sim_calibration", "platform", "sim_platform", 16, None),
+]
+
+
+def _enum(name: str) -> postgresql.ENUM:
+    return postgresql.ENUM(*ENUM_TYPES[name], name=name, create_type=False)
+
+
+def _alter_by_table(columns, actions) -> None:
+    # One ALTER TABLE per table, so each table is rewritten and its indexes rebuilt once.
+    by_table: dict[str, list[str]] = {}
+    for entry in columns:
+        by_table.setdefault(entry[0], []).extend(actions(*entry))
+    for table, table_actions in by_table.items():
+        op.execute(f"ALTER TABLE {table} {', '.join(table_actions)}")
+
+
+def _to_enum(_table, column, enum_name, _length, default) -> list[str]:
+    # A varchar default cannot be cast to the enum, so it is dropped and restored around
+    # the type change.
+    if default is None:
+        return [f"ALTER COLUMN {column} TYPE {enum_name} USING {column}::{enum_name}"]
+    return [
+        f"ALTER COLUMN {column} DROP DEFAULT",
+        f"ALTER COLUMN {column} TYPE {enum_name} USING {column}::{enum_name}",
+        f"ALTER COLUMN {column} SET DEFAULT '{default}'::{enum_name}",
+    ]
+
+
+def _to_varchar(_table, column, _enum_name, length, default) -> list[str]:
+    if default is None:
+        return [f"ALTER COLUMN {column} TYPE varchar({length}) USING {column}::text"]
+    return [
+        f"ALTER COLUMN {column} DROP DEFAULT",
+        f"ALTER COLUMN {column} TYPE varchar({length}) USING {column}::text",
+        f"ALTER COLUMN {column} SET DEFAULT '{default}'",
+    ]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for name in ENUM_TYPES:
+        _enum(name).create(bind, checkfirst=True)
+
+    _alter_by_table(ENUM_COLUMNS, _to_enum)
+
+
+def downgrade() -> None:
+    _alter_by_table(reversed(ENUM_COLUMNS), _to_varchar)
+
+    bind = op.get_bind()
+    for name in reversed(list(ENUM_TYPES)):
+        _enum(name).drop(bind, checkfirst=True)
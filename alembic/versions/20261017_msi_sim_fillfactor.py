@@ -0,0 +1,49 @@
+"""lower fillfactor on updated MSI/simulator tables
+
+Revision ID: 20261017_msi_sim_fillfactor
+Revises: 20261017_sim_calibration_key
+Create Date: 2026-10-17 12:40:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_fillfactor"
+down_revision = "20261017_sim_calibration_key"
+branch_labels = None
+depends_on = None
+
+
+FILLFACTORS = {
+    "msi_runs": 80,
+    "sim_runs": 80,
+    "msi_baselines": 80,
+}
+
+# (index, table, column) - never read, and the only indexes on columns that the
+# run/baseline updates rewrite, so they alone kept those updates from being HOT.
+HOT_BLOCKING_INDEXES = [
+    ("ix_msi_runs_status", "msi_runs", "status"),
+    ("ix_msi_baselines_last_updated", "msi_baselines", "last_updated"),
+]
+
+
+def upgrade() -> None:
+    # Runs move queued -> running -> completed/failed and baselines are rewritten on
+    # every run, so leave room on each page for the new tuple versions.
+    for table, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+    with op.get_context().autocommit_block():
+        for name, table, _column in HOT_BLOCKING_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(HOT_BLOCKING_INDEXES):
+            op.create_index(name, table, [column], postgresql_concurrently=True, if_not_exists=True)
+
+    for table in FILLFACTORS:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,65 @@
+"""use hash indexes for equality-only MSI/simulator run keys
+
+Revision ID: 20261017_msi_sim_hash_indexes
+Revises: 20261017_msi_sim_fillfactor
+Create Date: 2026-10-17 12:50:00
+"""
+
+from alembic import op
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_hash_indexes"
+down_revision = "20261017_msi_sim_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column)
+HASH_INDEXES = [
+    ("ix_msi_reports_run_id", "msi_reports", "run_id"),
+    ("ix_msi_artifacts_run_id", "msi_artifacts", "run_id"),
+    ("ix_sim_results_run_id", "sim_results", "run_id"),
+    ("ix_sim_feedback_run_id", "sim_feedback", "run_id"),
+    ("ix_sim_runs_idempotency_key", "sim_runs", "idempotency_key"),
+]
+
+
+def upgrade() -> None:
+    # Run ids and idempotency keys are opaque strings that are only ever matched by
+    # equality (service lookups and the ON DELETE CASCADE from the run tables), so a
+    # hash index stores a 4-byte hash per row instead of the whole key. The unique
+    # run_id constraints on msi_runs/sim_runs must stay btree; the job event tables
+    # are served by their (run_id, ts) btrees.
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes([f"{name}_hash" for name, _table, _column in HASH_INDEXES])
+        for name, table, column in HASH_INDEXES:
+            op.create_index(
+                f"{name}_hash",
+                table,
+                [column],
+                postgresql_using="hash",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    for name, _table, _column in HASH_INDEXES:
+        op.execute(f"ALTER INDEX {name}_hash RENAME TO {name}")
+
+
+def downgrade() -> None:
+    for name, _table, _column in HASH_INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_hash")
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(HASH_INDEXES):
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="btree",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(f"{name}_hash", table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,48 @@
+"""store remaining MSI/simulator JSON columns as JSONB
+
+Revision ID: 20261017_msi_sim_jsonb
+Revises: 20261017_msi_wl_aliases_jsonb
+Create Date: 2026-10-17 11:30:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_jsonb"
+down_revision = "20261017_msi_wl_aliases_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default literal or None)
+JSON_COLUMNS = [
+    ("msi_artifacts", "items_json", None),
+    ("msi_artifacts", "aggregates_json", None),
+    ("msi_baselines", "pressure_history", "'[]'"),
+    ("sim_results", "reactions_json", "'[]'"),
+    ("sim_results", "advice_json", "'{}'"),
+]
+
+
+def _retype(target: str) -> None:
+    actions: dict[str, list[str]] = {}
+    for table, column, default in JSON_COLUMNS:
+        table_actions = actions.setdefault(table, [])
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} DROP DEFAULT")
+        table_actions.append(f"ALTER COLUMN {column} TYPE {target} USING {column}::{target}")
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} SET DEFAULT {default}::{target}")
+    # One statement per table: msi_artifacts and sim_results are rewritten once each.
+    for table, table_actions in actions.items():
+        op.execute(f"ALTER TABLE {table} {', '.join(table_actions)}")
+
+
+def upgrade() -> None:
+    # Not indexed: these are only read back whole with their row.
+    _retype("jsonb")
+
+
+def downgrade() -> None:
+    _retype("json")
@@ -0,0 +1,53 @@
+"""store MSI/simulator report and event payloads as JSONB
+
+Revision ID: 20261017_msi_sim_payloads_jsonb
+Revises: 20261017_memory_prefix_indexes
+Create Date: 2026-10-17 11:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_payloads_jsonb"
+down_revision = "20261017_memory_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default literal or None)
+JSON_COLUMNS = [
+    ("msi_reports", "report_json", None),
+    ("msi_timeseries", "components_json", None),
+    ("msi_job_events", "payload_json", "'{}'"),
+    ("msi_baselines", "last_topic_dist", "'{}'"),
+    ("sim_results", "breakdown_json", "'{}'"),
+    ("sim_results", "red_flags_json", "'{}'"),
+    ("sim_job_events", "payload_json", "'{}'"),
+]
+
+
+def _retype(target: str) -> None:
+    # Each table's columns change in one ALTER TABLE so the table is rewritten once. A
+    # json default cannot be cast in place, so it is dropped and restored around the
+    # type change within that statement.
+    actions: dict[str, list[str]] = {}
+    for table, column, default in JSON_COLUMNS:
+        table_actions = actions.setdefault(table, [])
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} DROP DEFAULT")
+        table_actions.append(f"ALTER COLUMN {column} TYPE {target} USING {column}::{target}")
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} SET DEFAULT {default}::{target}")
+    for table, table_actions in actions.items():
+        op.execute(f"ALTER TABLE {table} {', '.join(table_actions)}")
+
+
+def upgrade() -> None:
+    # Not indexed: the payloads are read back whole with their row and nothing filters
+    # on their keys in SQL.
+    _retype("jsonb")
+
+
+def downgrade() -> None:
+    _retype("json")
@@ -0,0 +1,44 @@
+"""drop MSI/simulator indexes covered by composite indexes or unused
+
+Revision ID: 20261017_msi_sim_prefix_indexes
+Revises: 20261017_msi_sim_payloads_jsonb
+Create Date: 2026-10-17 11:10:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_sim_prefix_indexes"
+down_revision = "20261017_msi_sim_payloads_jsonb"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, covered by)
+REDUNDANT_INDEXES = [
+    ("ix_msi_timeseries_profile_id", "msi_timeseries", ["profile_id"], "ix_msi_timeseries_lookup"),
+    ("ix_msi_timeseries_entity", "msi_timeseries", ["entity"], "ix_msi_timeseries_lookup"),
+    ("ix_msi_timeseries_mode", "msi_timeseries", ["mode"], "ix_msi_timeseries_lookup"),
+    ("ix_msi_timeseries_period_end", "msi_timeseries", ["period_end"], "ix_msi_timeseries_lookup"),
+    ("ix_msi_job_events_run_id", "msi_job_events", ["run_id"], "ix_msi_job_events_run_ts"),
+    ("ix_sim_job_events_run_id", "sim_job_events", ["run_id"], "ix_sim_job_events_run_ts"),
+    ("ix_sim_runs_status", "sim_runs", ["status"], "ix_sim_runs_status_created"),
+]
+
+
+def upgrade() -> None:
+    # profile_id and run_id/status are leading columns of the covering index. The other
+    # msi_timeseries columns are never filtered on alone: reads always pin the whole
+    # (profile_id, entity, mode) prefix, and mode alone (daily|weekly) is too
+    # unselective to use an index. ix_sim_runs_created_at stays: it serves the
+    # "latest runs" listing, which is not filtered by status.
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _covered_by in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, _covered_by in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,56 @@
+"""cover msi/level in the msi_timeseries lookup index
+
+Revision ID: 20261017_msi_ts_covering
+Revises: 20261017_msi_sim_brin
+Create Date: 2026-10-17 12:10:00
+"""
+
+from alembic import op
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_ts_covering"
+down_revision = "20261017_msi_sim_brin"
+branch_labels = None
+depends_on = None
+
+
+LOOKUP_COLUMNS = ["profile_id", "entity", "mode", "period_end"]
+
+
+def upgrade() -> None:
+    # The key duplicated uq_msi_timeseries_point; carrying msi/level as INCLUDE columns
+    # lets the "top entities" dashboard read the latest points without heap fetches.
+    with op.get_context().autocommit_block():
+        covering = "ix_msi_timeseries_lookup_covering"
+        drop_invalid_indexes([covering])
+        op.create_index(
+            covering,
+            "msi_timeseries",
+            LOOKUP_COLUMNS,
+            postgresql_include=["msi", "level"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_msi_timeseries_lookup", table_name="msi_timeseries", postgresql_concurrently=True, if_exists=True)
+    op.execute("ALTER INDEX ix_msi_timeseries_lookup_covering RENAME TO ix_msi_timeseries_lookup")
+
+
+def downgrade() -> None:
+    op.execute("ALTER INDEX IF EXISTS ix_msi_timeseries_lookup RENAME TO ix_msi_timeseries_lookup_covering")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_msi_timeseries_lookup",
+            "msi_timeseries",
+            LOOKUP_COLUMNS,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_msi_timeseries_lookup_covering",
+            table_name="msi_timeseries",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
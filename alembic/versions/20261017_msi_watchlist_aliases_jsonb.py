@@ -0,0 +1,37 @@
+"""store msi_watchlist aliases as JSONB
+
+Revision ID: 20261017_msi_wl_aliases_jsonb
+Revises: 20261017_msi_sim_prefix_indexes
+Create Date: 2026-10-17 11:20:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_wl_aliases_jsonb"
+down_revision = "20261017_msi_sim_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _retype(target: str) -> None:
+    op.alter_column("msi_watchlist", "aliases_json", server_default=None)
+    op.alter_column(
+        "msi_watchlist",
+        "aliases_json",
+        type_=postgresql.JSONB() if target == "jsonb" else sa.JSON(),
+        postgresql_using=f"aliases_json::{target}",
+    )
+    op.alter_column("msi_watchlist", "aliases_json", server_default=sa.text(f"'[]'::{target}"))
+
+
+def upgrade() -> None:
+    # Not indexed: aliases are loaded with their watchlist row and matched in Python.
+    _retype("jsonb")
+
+
+def downgrade() -> None:
+    _retype("json")
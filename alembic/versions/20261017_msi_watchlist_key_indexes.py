@@ -0,0 +1,36 @@
+"""drop msi_watchlist indexes covered by the profile/entity unique key
+
+Revision ID: 20261017_msi_wl_key_indexes
+Revises: 20261017_deferrable_run_fks
+Create Date: 2026-10-17 13:20:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_wl_key_indexes"
+down_revision = "20261017_deferrable_run_fks"
+branch_labels = None
+depends_on = None
+
+
+# (index, column)
+REDUNDANT_INDEXES = [
+    ("ix_msi_watchlist_profile_id", "profile_id"),
+    ("ix_msi_watchlist_entity", "entity"),
+]
+
+
+def upgrade() -> None:
+    # Every watchlist lookup pins both profile_id and entity, which
+    # uq_msi_watchlist_profile_entity already serves; entity is never matched alone.
+    with op.get_context().autocommit_block():
+        for name, _column in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name="msi_watchlist", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, "msi_watchlist", [column], postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,54 @@
+"""replace msi_watchlist enabled index with per-mode partial indexes
+
+Revision ID: 20261017_msi_wl_partial_indexes
+Revises: 20261017_msi_sim_enums
+Create Date: 2026-10-17 11:50:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_msi_wl_partial_indexes"
+down_revision = "20261017_msi_sim_enums"
+branch_labels = None
+depends_on = None
+
+
+# (index, predicate) - both keyed on updated_at, the scheduler's sort column.
+PARTIAL_INDEXES = [
+    ("ix_msi_watchlist_daily", "enabled IS TRUE AND run_daily IS TRUE"),
+    ("ix_msi_watchlist_weekly", "enabled IS TRUE AND run_weekly IS TRUE"),
+]
+
+
+def upgrade() -> None:
+    # The daily/weekly schedulers only ever read enabled rows for their own mode, so
+    # each gets a partial index holding just those rows instead of a boolean index
+    # over the whole watchlist. The predicates are spelled with IS TRUE to match the
+    # service filters: the planner does not treat `x IS TRUE` as implying a bare `x`.
+    with op.get_context().autocommit_block():
+        for name, predicate in PARTIAL_INDEXES:
+            op.create_index(
+                name,
+                "msi_watchlist",
+                ["updated_at"],
+                postgresql_where=sa.text(predicate),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        op.drop_index("ix_msi_watchlist_enabled", table_name="msi_watchlist", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_msi_watchlist_enabled",
+            "msi_watchlist",
+            ["enabled"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, _predicate in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name="msi_watchlist", postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,44 @@
+"""drop project memory indexes covered by composite indexes
+
+Revision ID: 20261017_memory_prefix_indexes
+Revises: 20261017_hot_update_fillfactor
+Create Date: 2026-10-17 10:50:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_memory_prefix_indexes"
+down_revision = "20261017_hot_update_fillfactor"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, covered by)
+REDUNDANT_INDEXES = [
+    ("ix_project_memory_items_memory_type", "project_memory_items", ["memory_type"], "ix_project_memory_type_status_updated"),
+    (
+        "ix_project_memory_items_memory_subtype",
+        "project_memory_items",
+        ["memory_subtype"],
+        "ix_project_memory_subtype_freshness",
+    ),
+    ("ix_project_memory_events_memory_id", "project_memory_events", ["memory_id"], "ix_project_memory_events_memory_created"),
+]
+
+
+def upgrade() -> None:
+    # Each of these is the leading column of the composite index named in
+    # REDUNDANT_INDEXES, which already serves the lookups (and the ON DELETE CASCADE
+    # scan for memory_id). The user_activity_logs username indexes stay: no composite
+    # index leads with those columns.
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _covered_by in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, _covered_by in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
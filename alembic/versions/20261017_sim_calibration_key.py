@@ -0,0 +1,59 @@
+"""unique (platform, bucket) key on sim_calibration
+
+Revision ID: 20261017_sim_calibration_key
+Revises: 20261017_msi_ts_covering
+Create Date: 2026-10-17 12:30:00
+"""
+
+from alembic import op
+
+from migration_helpers import constraint_exists, drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_sim_calibration_key"
+down_revision = "20261017_msi_ts_covering"
+branch_labels = None
+depends_on = None
+
+
+# Covered by the (platform, bucket) unique index; bucket is never looked up alone.
+REDUNDANT_INDEXES = [
+    ("ix_sim_calibration_platform", "platform"),
+    ("ix_sim_calibration_bucket", "bucket"),
+]
+
+
+def upgrade() -> None:
+    # (platform, bucket) is the logical key: keep the most recently updated row of any
+    # duplicates so writers can upsert with ON CONFLICT and readers do a point lookup.
+    op.execute(
+        """
+        DELETE FROM sim_calibration c
+        USING (
+            SELECT id, ROW_NUMBER() OVER (PARTITION BY platform, bucket ORDER BY updated_at DESC, id DESC) AS rn
+            FROM sim_calibration
+        ) ranked
+        WHERE c.id = ranked.id AND ranked.rn > 1
+        """
+    )
+
+    # Build the unique index concurrently, then attach it as the constraint.
+    # Rebuild an INVALID leftover from a failed run instead of attaching it.
+    with op.get_context().autocommit_block():
+        if "uq_sim_calibration_key" not in drop_invalid_indexes(["uq_sim_calibration_key"]):
+            op.execute("CREATE UNIQUE INDEX CONCURRENTLY uq_sim_calibration_key ON sim_calibration (platform, bucket)")
+    if not constraint_exists("uq_sim_calibration_key"):
+        op.execute("ALTER TABLE sim_calibration ADD CONSTRAINT uq_sim_calibration_key UNIQUE USING INDEX uq_sim_calibration_key")
+
+    with op.get_context().autocommit_block():
+        for name, _column in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name="sim_calibration", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, column in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, "sim_calibration", [column], postgresql_concurrently=True, if_not_exists=True)
+    if constraint_exists("uq_sim_calibration_key"):
+        op.drop_constraint("uq_sim_calibration_key", "sim_calibration", type_="unique")
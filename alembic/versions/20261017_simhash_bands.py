@@ -0,0 +1,57 @@
+"""add simhash LSH band columns to article_fingerprints
+
+Revision ID: 20261017_simhash_bands
+Revises: 20261017_knowledge_jsonb
+Create Date: 2026-10-17 10:00:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_simhash_bands"
+down_revision = "20261017_knowledge_jsonb"
+branch_labels = None
+depends_on = None
+
+
+BANDS = 4
+BAND_BITS = 16
+
+
+def _band_expression(band: int) -> str:
+    return f"((simhash >> {(BANDS - 1 - band) * BAND_BITS}) & 65535)::integer"
+
+
+def upgrade() -> None:
+    # Four 16-bit bands of the 64-bit simhash. Two fingerprints within Hamming distance 3
+    # always share at least one band, so near-duplicate candidates come from index
+    # lookups instead of scanning the recent window only.
+    # Stored generated columns rewrite the table under ACCESS EXCLUSIVE; adding all four
+    # in one ALTER TABLE pays for that rewrite once.
+    op.execute(
+        "ALTER TABLE article_fingerprints "
+        + ", ".join(
+            f"ADD COLUMN simhash_b{band} integer GENERATED ALWAYS AS ({_band_expression(band)}) STORED"
+            for band in range(BANDS)
+        )
+    )
+
+    with op.get_context().autocommit_block():
+        for band in range(BANDS):
+            op.create_index(
+                f"ix_article_fingerprints_simhash_b{band}",
+                "article_fingerprints",
+                [f"simhash_b{band}"],
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    # Dropping the columns drops their indexes; both are catalog-only.
+    op.execute(
+        "ALTER TABLE article_fingerprints "
+        + ", ".join(f"DROP COLUMN simhash_b{band}" for band in reversed(range(BANDS)))
+    )
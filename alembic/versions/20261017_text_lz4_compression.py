@@ -0,0 +1,48 @@
+"""use lz4 TOAST compression for large text columns
+
+Revision ID: 20261017_text_lz4_compression
+Revises: 20261017_simhash_bands
+Create Date: 2026-10-17 10:10:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_text_lz4_compression"
+down_revision = "20261017_simhash_bands"
+branch_labels = None
+depends_on = None
+
+
+TEXT_COLUMNS = [
+    ("editorial_drafts", "body"),
+    ("article_profiles", "normalized_content"),
+    ("article_chunks", "content"),
+]
+
+
+def _lz4_available() -> bool:
+    bind = op.get_bind()
+    enumvals = bind.execute(
+        sa.text("SELECT enumvals FROM pg_settings WHERE name = 'default_toast_compression'")
+    ).scalar()
+    return bool(enumvals) and "lz4" in enumvals
+
+
+def upgrade() -> None:
+    # Arabic article text still compresses well, so storage stays EXTENDED (not
+    # EXTERNAL); lz4 keeps most of the size win at a fraction of pglz's CPU cost on
+    # write and detoast. Applies to newly written values only, no table rewrite.
+    if not _lz4_available():
+        return
+    for table, column in TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION lz4")
+
+
+def downgrade() -> None:
+    if not _lz4_available():
+        return
+    for table, column in TEXT_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION default")
@@ -0,0 +1,107 @@
+"""server-side now() defaults and NOT NULL for created_at/updated_at
+
+Revision ID: 20261017_timestamp_defaults
+Revises: 20261017_articles_event_time
+Create Date: 2026-10-17 09:40:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_timestamp_defaults"
+down_revision = "20261017_articles_event_time"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 10000
+
+TIMESTAMP_COLUMNS = {
+    "api_settings": ["updated_at"],
+    "settings_audit": ["created_at"],
+    "constitution_meta": ["updated_at"],
+    "image_prompts": ["created_at"],
+    "infographics": ["created_at"],
+    "editorial_drafts": ["created_at", "updated_at"],
+    "article_profiles": ["created_at", "updated_at"],
+    "article_topics": ["created_at"],
+    "article_entities": ["created_at"],
+    "article_chunks": ["created_at", "updated_at"],
+    "article_vectors": ["created_at", "updated_at"],
+    "story_clusters": ["created_at", "updated_at"],
+    "story_cluster_members": ["created_at"],
+    "article_fingerprints": ["created_at", "updated_at"],
+    "article_relations": ["created_at"],
+}
+
+
+def _check(table: str, column: str) -> str:
+    return f"ck_{table}_{column}_not_null"
+
+
+def _backfill(bind, table: str, columns: list[str]) -> None:
+    # A NULL created_at/updated_at takes its sibling timestamp when the row has one.
+    assignments = []
+    for column in columns:
+        sources = [column] + [other for other in columns if other != column]
+        assignments.append(f"{column} = coalesce({', '.join(sources)}, now())")
+    missing = " OR ".join(f"{column} IS NULL" for column in columns)
+    min_id, max_id = bind.execute(sa.text(f"SELECT min(id), max(id) FROM {table}")).one()
+    if min_id is None:
+        return
+    for lo in range(min_id, max_id + 1, BACKFILL_BATCH_SIZE):
+        bind.execute(
+            sa.text(f"UPDATE {table} SET {', '.join(assignments)} WHERE ({missing}) AND id BETWEEN :lo AND :hi"),
+            {"lo": lo, "hi": lo + BACKFILL_BATCH_SIZE - 1},
+        )
+
+
+def upgrade() -> None:
+    # Columns stay `timestamp without time zone`: the application writes naive UTC
+    # datetimes everywhere, and a type change would rewrite every table.
+    # The ALTERs are catalog-only but take ACCESS EXCLUSIVE, so they stay in the
+    # migration transaction under lock_timeout, one statement per table. Only the
+    # backfill and the VALIDATE scans run in autocommit: NOT NULL is proven through a
+    # NOT VALID check validated under SHARE UPDATE EXCLUSIVE, so the final SET NOT NULL
+    # skips the full-table scan.
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} " + ", ".join(f"ALTER COLUMN {column} SET DEFAULT now()" for column in columns)
+        )
+
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        for table, columns in TIMESTAMP_COLUMNS.items():
+            _backfill(bind, table, columns)
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"DROP CONSTRAINT IF EXISTS {_check(table, column)}" for column in columns)
+        )
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(
+                f"ADD CONSTRAINT {_check(table, column)} CHECK ({column} IS NOT NULL) NOT VALID" for column in columns
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        for table, columns in TIMESTAMP_COLUMNS.items():
+            for column in columns:
+                op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {_check(table, column)}")
+
+    # The checks are dropped in a second statement: within one ALTER TABLE the drop would
+    # happen before SET NOT NULL looks for a constraint that proves it.
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        op.execute(f"ALTER TABLE {table} " + ", ".join(f"ALTER COLUMN {column} SET NOT NULL" for column in columns))
+        op.execute(f"ALTER TABLE {table} " + ", ".join(f"DROP CONSTRAINT {_check(table, column)}" for column in columns))
+
+
+def downgrade() -> None:
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        op.execute(
+            f"ALTER TABLE {table} "
+            + ", ".join(f"ALTER COLUMN {column} DROP NOT NULL, ALTER COLUMN {column} DROP DEFAULT" for column in columns)
+        )
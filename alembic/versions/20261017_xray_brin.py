@@ -0,0 +1,63 @@
+"""use BRIN for competitor_xray insert timestamps
+
+Revision ID: 20261017_xray_brin
+Revises: 20261017_xray_media_time_idx
+Create Date: 2026-10-17 14:40:00
+"""
+
+from alembic import op
+
+from migration_helpers import drop_invalid_indexes
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_brin"
+down_revision = "20261017_xray_media_time_idx"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column)
+BRIN_INDEXES = [
+    ("ix_competitor_xray_runs_created_at", "competitor_xray_runs", "created_at"),
+    ("ix_competitor_xray_items_created_at", "competitor_xray_items", "created_at"),
+]
+
+
+def upgrade() -> None:
+    # Both columns are set once at insert, so they follow the heap order. Runs are only
+    # range-filtered by it (the 5-minute idempotency window) and items only sort by it
+    # after priority, inside ix_competitor_xray_items_priority_created.
+    # ix_media_logger_runs_created_at stays a btree: the runs listing reads it in index
+    # order with a LIMIT, which BRIN cannot serve.
+    with op.get_context().autocommit_block():
+        drop_invalid_indexes([f"{name}_brin" for name, _table, _column in BRIN_INDEXES])
+        for name, table, column in BRIN_INDEXES:
+            op.create_index(
+                f"{name}_brin",
+                table,
+                [column],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    for name, _table, _column in BRIN_INDEXES:
+        op.execute(f"ALTER INDEX {name}_brin RENAME TO {name}")
+
+
+def downgrade() -> None:
+    for name, _table, _column in BRIN_INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_brin")
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(BRIN_INDEXES):
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="btree",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(f"{name}_brin", table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,54 @@
+"""index competitor_xray_items by status then priority
+
+Revision ID: 20261017_xray_items_status_prio
+Revises: 20261017_media_logger_idem_uq
+Create Date: 2026-10-17 15:20:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_items_status_prio"
+down_revision = "20261017_media_logger_idem_uq"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The gap widgets list `status = 'new'` items by priority_score DESC, created_at DESC.
+    # Leading with status lets that LIMIT read the first N entries of one status range;
+    # the unfiltered listing keeps using ix_competitor_xray_items_priority_created
+    # backwards. The single-column status index is a prefix of the new one.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_competitor_xray_items_status_priority",
+            "competitor_xray_items",
+            ["status", sa.text("priority_score DESC"), sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_competitor_xray_items_status",
+            table_name="competitor_xray_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_competitor_xray_items_status",
+            "competitor_xray_items",
+            ["status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_competitor_xray_items_status_priority",
+            table_name="competitor_xray_items",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,35 @@
+"""lower fillfactor on updated competitor_xray/media_logger tables
+
+Revision ID: 20261017_xray_media_fillfactor
+Revises: 20261017_xray_brin
+Create Date: 2026-10-17 14:50:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_media_fillfactor"
+down_revision = "20261017_xray_brin"
+branch_labels = None
+depends_on = None
+
+
+FILLFACTORS = {
+    "competitor_xray_runs": 80,
+    "media_logger_runs": 80,
+    "competitor_xray_items": 90,
+}
+
+
+def upgrade() -> None:
+    # Runs are rewritten at every stage (status, counters, transcript, finished_at,
+    # error); items only when an editor marks them used or ignored. Free space on each
+    # page keeps the new tuple versions next to the old ones.
+    for table, fillfactor in FILLFACTORS.items():
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = {fillfactor})")
+
+
+def downgrade() -> None:
+    for table in FILLFACTORS:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,48 @@
+"""store competitor_xray/media_logger JSON columns as JSONB
+
+Revision ID: 20261017_xray_media_jsonb
+Revises: 20261017_xray_text_columns
+Create Date: 2026-10-17 13:50:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_media_jsonb"
+down_revision = "20261017_xray_text_columns"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, server default literal or None)
+JSON_COLUMNS = [
+    ("competitor_xray_items", "angle_questions_json", "'[]'"),
+    ("competitor_xray_items", "starter_sources_json", "'[]'"),
+    ("competitor_xray_events", "payload_json", "'{}'"),
+    ("media_logger_job_events", "payload_json", "'{}'"),
+]
+
+
+def _retype(target: str) -> None:
+    actions: dict[str, list[str]] = {}
+    for table, column, default in JSON_COLUMNS:
+        table_actions = actions.setdefault(table, [])
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} DROP DEFAULT")
+        table_actions.append(f"ALTER COLUMN {column} TYPE {target} USING {column}::{target}")
+        if default is not None:
+            table_actions.append(f"ALTER COLUMN {column} SET DEFAULT {default}::{target}")
+    # One statement per table: competitor_xray_items is rewritten once.
+    for table, table_actions in actions.items():
+        op.execute(f"ALTER TABLE {table} {', '.join(table_actions)}")
+
+
+def upgrade() -> None:
+    # Not indexed: angles are read back with their item and event payloads are only
+    # streamed per run, never filtered by key.
+    _retype("jsonb")
+
+
+def downgrade() -> None:
+    _retype("json")
@@ -0,0 +1,45 @@
+"""drop competitor_xray/media_logger indexes covered by composite indexes
+
+Revision ID: 20261017_xray_media_prefix_idx
+Revises: 20261017_msi_wl_key_indexes
+Create Date: 2026-10-17 13:30:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_media_prefix_idx"
+down_revision = "20261017_msi_wl_key_indexes"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, columns, covered by)
+REDUNDANT_INDEXES = [
+    ("ix_competitor_xray_runs_status", "competitor_xray_runs", ["status"], "ix_competitor_xray_runs_status_created"),
+    (
+        "ix_competitor_xray_items_priority_score",
+        "competitor_xray_items",
+        ["priority_score"],
+        "ix_competitor_xray_items_priority_created",
+    ),
+    ("ix_competitor_xray_events_run_id", "competitor_xray_events", ["run_id"], "ix_competitor_xray_events_run_ts"),
+    ("ix_media_logger_segments_run_id", "media_logger_segments", ["run_id"], "ix_media_logger_segments_run_order"),
+    ("ix_media_logger_highlights_run_id", "media_logger_highlights", ["run_id"], "ix_media_logger_highlights_run_rank"),
+    ("ix_media_logger_job_events_run_id", "media_logger_job_events", ["run_id"], "ix_media_logger_job_events_run_ts"),
+]
+
+
+def upgrade() -> None:
+    # Each column is the leading column of the covering composite, which serves the
+    # same equality/range predicates (and the ON DELETE CASCADE lookups on run_id).
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _covered_by in REDUNDANT_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, _covered_by in reversed(REDUNDANT_INDEXES):
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
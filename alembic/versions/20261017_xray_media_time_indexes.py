@@ -0,0 +1,39 @@
+"""drop global time indexes on per-run competitor_xray/media_logger tables
+
+Revision ID: 20261017_xray_media_time_idx
+Revises: 20261017_drop_xray_items_url_idx
+Create Date: 2026-10-17 14:30:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_media_time_idx"
+down_revision = "20261017_drop_xray_items_url_idx"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column)
+TIME_INDEXES = [
+    ("ix_competitor_xray_events_ts", "competitor_xray_events", "ts"),
+    ("ix_media_logger_job_events_ts", "media_logger_job_events", "ts"),
+    ("ix_media_logger_segments_created_at", "media_logger_segments", "created_at"),
+    ("ix_media_logger_highlights_created_at", "media_logger_highlights", "created_at"),
+]
+
+
+def upgrade() -> None:
+    # These rows are only ever read per run (events by run_id and id, segments and
+    # highlights by run_id in segment/rank order); nothing scans them by time across
+    # runs, so the timestamp indexes were pure insert overhead.
+    with op.get_context().autocommit_block():
+        for name, table, _column in TIME_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(TIME_INDEXES):
+            op.create_index(name, table, [column], postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,54 @@
+"""replace competitor_xray_sources enabled index with a partial index
+
+Revision ID: 20261017_xray_sources_partial
+Revises: 20261017_xray_media_jsonb
+Create Date: 2026-10-17 14:00:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_sources_partial"
+down_revision = "20261017_xray_media_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The scanner only reads enabled sources, ordered by weight then name. The partial
+    # index holds just those rows in that order; IS TRUE matches the service filter
+    # (the planner does not treat `x IS TRUE` as implying a bare `x`).
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_competitor_xray_sources_active",
+            "competitor_xray_sources",
+            [sa.text("weight DESC"), "name"],
+            postgresql_where=sa.text("enabled IS TRUE"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_competitor_xray_sources_enabled",
+            table_name="competitor_xray_sources",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_competitor_xray_sources_enabled",
+            "competitor_xray_sources",
+            ["enabled"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_competitor_xray_sources_active",
+            table_name="competitor_xray_sources",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
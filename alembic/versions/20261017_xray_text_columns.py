@@ -0,0 +1,37 @@
+"""store long competitor_xray strings as text
+
+Revision ID: 20261017_xray_text_columns
+Revises: 20261017_xray_media_prefix_idx
+Create Date: 2026-10-17 13:40:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_text_columns"
+down_revision = "20261017_xray_media_prefix_idx"
+branch_labels = None
+depends_on = None
+
+
+# (table, column, previous varchar length)
+TEXT_COLUMNS = [
+    ("competitor_xray_sources", "feed_url", 2048),
+    ("competitor_xray_items", "competitor_title", 1024),
+    ("competitor_xray_items", "competitor_url", 2048),
+]
+
+
+def upgrade() -> None:
+    # Feed titles and URLs come from external RSS and are not ours to cap. varchar(n) ->
+    # text is binary-compatible, so this is a catalog-only change: no table rewrite
+    # and no index rebuild.
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), existing_type=sa.String(length=length))
+
+
+def downgrade() -> None:
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length=length), existing_type=sa.Text())
@@ -0,0 +1,38 @@
+"""drop unqueried timestamp indexes on competitor_xray sources and items
+
+Revision ID: 20261017_xray_timestamp_idx
+Revises: 20261017_media_runs_covering
+Create Date: 2026-10-17 15:40:00
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261017_xray_timestamp_idx"
+down_revision = "20261017_media_runs_covering"
+branch_labels = None
+depends_on = None
+
+
+# (index, table, column)
+TIMESTAMP_INDEXES = [
+    ("ix_competitor_xray_sources_created_at", "competitor_xray_sources", "created_at"),
+    ("ix_competitor_xray_sources_updated_at", "competitor_xray_sources", "updated_at"),
+    ("ix_competitor_xray_items_updated_at", "competitor_xray_items", "updated_at"),
+]
+
+
+def upgrade() -> None:
+    # Sources are listed by weight/name and items by status/priority; neither timestamp
+    # is filtered or sorted on. updated_at changes on every write, so its index took an
+    # entry for each edit as well as each insert.
+    with op.get_context().autocommit_block():
+        for name, table, _column in TIMESTAMP_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(TIMESTAMP_INDEXES):
+            op.create_index(name, table, [column], postgresql_concurrently=True, if_not_exists=True)
@@ -207,7 +207,7 @@ class ScribeAgent:
                 Article.source_name,
                 Article.original_url,
                 Article.category,
-                ArticleVector.embedding.cosine_distance(query_vec).label("dist"),
+                ArticleVector.embedding_half.cosine_distance(query_vec).label("dist"),
             )
             .join(ArticleVector, ArticleVector.article_id == Article.id)
             .where(
@@ -215,7 +215,7 @@ class ScribeAgent:
                 Article.status != NewsStatus.ARCHIVED,
                 Article.id != article.id,
             )
-            .order_by(ArticleVector.embedding.cosine_distance(query_vec))
+            .order_by(ArticleVector.embedding_half.cosine_distance(query_vec))
             .limit(limit * 4)
         )
         rows = await db.execute(stmt)
@@ -403,11 +403,11 @@ async def semantic_search(
     stmt = (
         select(
             Article,
-            ArticleVector.embedding.cosine_distance(query_vec).label("dist"),
+            ArticleVector.embedding_half.cosine_distance(query_vec).label("dist"),
         )
         .join(ArticleVector, ArticleVector.article_id == Article.id)
         .where(ArticleVector.vector_type.in_(["title", "summary"]))
-        .order_by(ArticleVector.embedding.cosine_distance(query_vec))
+        .order_by(ArticleVector.embedding_half.cosine_distance(query_vec))
         .limit(pool_size)
     )
     if status:
@@ -576,7 +576,7 @@ async def related_articles(
                 Article.status != NewsStatus.ARCHIVED,
             )
         )
-        .order_by(ArticleVector.embedding.cosine_distance(src_vec.embedding))
+        .order_by(ArticleVector.embedding_half.cosine_distance(src_vec.embedding))
         .limit(limit)
     )
     rows = await db.execute(stmt)
@@ -33,6 +33,10 @@ class Settings(BaseSettings):
     postgres_db: str = "echorouk_db"
     postgres_user: str = "echorouk"
     postgres_password: str = Field(..., min_length=8)
+    # Alembic: transactional DDL gives up on a blocked lock after this long and the run is
+    # retried, instead of queueing an ACCESS EXCLUSIVE request that stalls all traffic.
+    migration_lock_timeout: str = "3s"
+    migration_lock_retries: int = 5
 
     @property
     def database_url(self) -> str:
@@ -5,7 +5,7 @@ Tracks changes to API settings for admin visibility.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Index, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Index, JSON, func
 
 from app.core.database import Base
 
@@ -19,7 +19,7 @@ class SettingsAudit(Base):
     old_value = Column(Text, nullable=True)
     new_value = Column(Text, nullable=True)
     actor = Column(String(100), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
 
     __table_args__ = (Index("ix_settings_audit_created_at", "created_at"),)
 
@@ -28,8 +28,8 @@ class ActionAuditLog(Base):
     __tablename__ = "action_audit_logs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    action = Column(String(80), nullable=False, index=True)
-    entity_type = Column(String(80), nullable=False, index=True)
+    action = Column(String(80), nullable=False)
+    entity_type = Column(String(80), nullable=False)
     entity_id = Column(String(120), nullable=True, index=True)
     from_state = Column(String(64), nullable=True)
     to_state = Column(String(64), nullable=True)
@@ -39,8 +39,10 @@ class ActionAuditLog(Base):
     actor_username = Column(String(100), nullable=True, index=True)
     correlation_id = Column(String(64), nullable=True, index=True)
     request_id = Column(String(64), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
+        Index("ix_action_audit_action_created", action, created_at.desc()),
         Index("ix_action_audit_entity_created", "entity_type", "entity_id", "created_at"),
+        Index("ix_action_audit_created_at", created_at, postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
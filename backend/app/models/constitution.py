@@ -5,7 +5,7 @@ Tracks editorial constitution version and user acknowledgements.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -18,7 +18,7 @@ class ConstitutionMeta(Base):
     version = Column(String(50), nullable=False)
     file_url = Column(String(255), nullable=False, default="/Constitution.docx")
     is_active = Column(Boolean, default=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_constitution_meta_version", "version"),
@@ -46,7 +46,7 @@ class ImagePrompt(Base):
     article_id = Column(Integer, nullable=True, index=True)
     prompt_text = Column(Text, nullable=False)
     style = Column(String(50), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
     created_by = Column(String(100), nullable=True)
 
     __table_args__ = (
@@ -61,7 +61,7 @@ class InfographicData(Base):
     article_id = Column(Integer, nullable=True, index=True)
     data_json = Column(Text, nullable=False)
     prompt_text = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
     created_by = Column(String(100), nullable=True)
 
     __table_args__ = (
@@ -5,8 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Index, Integer, JSON, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 
 from app.core.database import Base
 
@@ -15,8 +15,8 @@ class JobRun(Base):
     __tablename__ = "job_runs"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    job_type = Column(String(64), nullable=False, index=True)
-    queue_name = Column(String(64), nullable=False, index=True)
+    job_type = Column(String(64), nullable=False)
+    queue_name = Column(String(64), nullable=False)
     entity_id = Column(String(64), nullable=True, index=True)
     status = Column(String(24), nullable=False, default="queued", index=True)  # queued|running|completed|failed|dead_lettered
     priority = Column(String(16), nullable=False, default="normal")
@@ -30,14 +30,15 @@ class JobRun(Base):
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
-    payload_json = Column(JSON, nullable=False, default=dict)
-    result_json = Column(JSON, nullable=True)
+    payload_json = Column(JSONB, nullable=False, default=dict)
+    result_json = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     __table_args__ = (
         Index("ix_job_runs_queue_status", "queue_name", "status"),
         Index("ix_job_runs_type_queued", "job_type", "queued_at"),
+        Index("ix_job_runs_queued_at_pending", queued_at, postgresql_where=status.in_(("queued", "running"))),
     )
 
 
@@ -51,6 +52,6 @@ class DeadLetterJob(Base):
     failed_at = Column(DateTime, default=datetime.utcnow, index=True)
     error = Column(Text, nullable=False)
     traceback = Column(Text, nullable=True)
-    payload_json = Column(JSON, nullable=False, default=dict)
-    meta_json = Column(JSON, nullable=False, default=dict)
+    payload_json = Column(JSONB, nullable=False, default=dict)
+    meta_json = Column(JSONB, nullable=False, default=dict)
 
@@ -4,21 +4,24 @@ Knowledge/Archive models for deep editorial retrieval and vector search.
 
 from datetime import datetime
 
-from pgvector.sqlalchemy import Vector
+from pgvector.sqlalchemy import HALFVEC, Vector
 from sqlalchemy import (
     BigInteger,
     Column,
+    Computed,
     DateTime,
     Float,
     ForeignKey,
     Index,
     Integer,
-    JSON,
     String,
     Text,
     UniqueConstraint,
+    cast,
+    func,
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import deferred, relationship
 
 from app.core.database import Base
 
@@ -27,20 +30,20 @@ class ArticleProfile(Base):
     __tablename__ = "article_profiles"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, unique=True, index=True)
-    archive_code = Column(String(32), nullable=False, unique=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, unique=True)
+    archive_code = Column(String(32), nullable=False, unique=True)
     language = Column(String(8), nullable=False, default="ar")
     normalized_title = Column(String(1024), nullable=True)
     normalized_summary = Column(Text, nullable=True)
     normalized_content = Column(Text, nullable=True)
     canonical_url = Column(String(2048), nullable=True)
     source_name = Column(String(255), nullable=True, index=True)
-    category = Column(String(64), nullable=True, index=True)
+    category = Column(String(64), nullable=True)
     editorial_status = Column(String(64), nullable=True, index=True)
-    metadata_json = Column(JSON, nullable=True, default=dict)
+    metadata_json = Column(JSONB, nullable=True, default=dict)
     search_text = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     article = relationship("Article")
 
@@ -53,11 +56,11 @@ class ArticleTopic(Base):
     __tablename__ = "article_topics"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
     topic = Column(String(128), nullable=False, index=True)
     confidence = Column(Float, nullable=False, default=0.5)
     source = Column(String(32), nullable=False, default="rule")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
 
     article = relationship("Article")
 
@@ -70,12 +73,12 @@ class ArticleEntity(Base):
     __tablename__ = "article_entities"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
     entity = Column(String(256), nullable=False, index=True)
     entity_type = Column(String(32), nullable=False, default="unknown", index=True)
     confidence = Column(Float, nullable=False, default=0.5)
     source = Column(String(32), nullable=False, default="rule")
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
 
     article = relationship("Article")
 
@@ -88,19 +91,18 @@ class ArticleChunk(Base):
     __tablename__ = "article_chunks"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
     chunk_index = Column(Integer, nullable=False)
     language = Column(String(8), nullable=False, default="ar")
     content = Column(Text, nullable=False)
     content_length = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     article = relationship("Article")
 
     __table_args__ = (
         UniqueConstraint("article_id", "chunk_index", name="uq_article_chunks_article_chunk"),
-        Index("ix_article_chunks_article_idx", "article_id", "chunk_index"),
     )
 
 
@@ -108,15 +110,17 @@ class ArticleVector(Base):
     __tablename__ = "article_vectors"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
     chunk_id = Column(Integer, ForeignKey("article_chunks.id"), nullable=True, index=True)
     vector_type = Column(String(32), nullable=False, index=True)  # title|summary|chunk|query
     model = Column(String(64), nullable=False, default="hash-v1")
     dim = Column(Integer, nullable=False, default=256)
     embedding = Column(Vector(256), nullable=False)
+    # FP16 view of `embedding`; matches the expression of ix_article_vectors_embedding_half_hnsw.
+    embedding_half = deferred(cast(embedding, HALFVEC(256)))
     content_hash = Column(String(64), nullable=False, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     article = relationship("Article")
     chunk = relationship("ArticleChunk")
@@ -131,22 +135,22 @@ class StoryCluster(Base):
     __tablename__ = "story_clusters"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    cluster_key = Column(String(64), nullable=False, unique=True, index=True)
+    cluster_key = Column(String(64), nullable=False, unique=True)
     label = Column(String(256), nullable=True)
     geography = Column(String(16), nullable=True, default="DZ", index=True)
     category = Column(String(64), nullable=True, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
 
 class StoryClusterMember(Base):
     __tablename__ = "story_cluster_members"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    cluster_id = Column(Integer, ForeignKey("story_clusters.id"), nullable=False, index=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    cluster_id = Column(Integer, ForeignKey("story_clusters.id"), nullable=False)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
     score = Column(Float, nullable=False, default=0.0)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
 
     cluster = relationship("StoryCluster")
     article = relationship("Article")
@@ -161,12 +165,17 @@ class ArticleFingerprint(Base):
     __tablename__ = "article_fingerprints"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, unique=True, index=True)
+    article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False, unique=True)
     simhash = Column(BigInteger, nullable=False, index=True)
+    # 16-bit LSH bands of the simhash (high to low), used for near-duplicate candidate lookup.
+    simhash_b0 = Column(Integer, Computed("((simhash >> 48) & 65535)::integer", persisted=True), index=True)
+    simhash_b1 = Column(Integer, Computed("((simhash >> 32) & 65535)::integer", persisted=True), index=True)
+    simhash_b2 = Column(Integer, Computed("((simhash >> 16) & 65535)::integer", persisted=True), index=True)
+    simhash_b3 = Column(Integer, Computed("((simhash >> 0) & 65535)::integer", persisted=True), index=True)
     token_count = Column(Integer, nullable=False, default=0)
-    shingles = Column(JSON, nullable=True, default=list)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    shingles = Column(JSONB, nullable=True, default=list)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     article = relationship("Article")
 
@@ -175,12 +184,12 @@ class ArticleRelation(Base):
     __tablename__ = "article_relations"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    from_article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
-    to_article_id = Column(Integer, ForeignKey("articles.id"), nullable=False, index=True)
+    from_article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False)
+    to_article_id = Column(Integer, ForeignKey("articles.id", deferrable=True, initially="IMMEDIATE"), nullable=False, index=True)
     relation_type = Column(String(32), nullable=False, index=True)  # duplicate_variant|sequence|impact|contrast|related
     score = Column(Float, nullable=False, default=0.0)
-    metadata_json = Column(JSON, nullable=True, default=dict)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    metadata_json = Column(JSONB, nullable=True, default=dict)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
 
     from_article = relationship("Article", foreign_keys=[from_article_id])
     to_article = relationship("Article", foreign_keys=[to_article_id])
@@ -5,7 +5,8 @@ Transcript runs, segments, highlights, and live job events.
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.database import Base
 
@@ -14,18 +15,18 @@ class MediaLoggerRun(Base):
     __tablename__ = "media_logger_runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), nullable=False, unique=True, index=True)
+    run_id = Column(String(64), nullable=False)
     source_type = Column(String(16), nullable=False, default="url", index=True)  # url|upload
     source_ref = Column(Text, nullable=False)  # URL or local file path
     source_label = Column(String(255), nullable=True)  # Friendly source label (filename/title)
     language_hint = Column(String(16), nullable=False, default="ar")
-    status = Column(String(24), nullable=False, default="queued", index=True)  # queued|running|completed|failed
+    status = Column(String(24), nullable=False, default="queued")  # queued|running|completed|failed
     transcript_language = Column(String(16), nullable=True)
     transcript_text = Column(Text, nullable=True)
     duration_seconds = Column(Float, nullable=True)
     segments_count = Column(Integer, nullable=False, default=0)
     highlights_count = Column(Integer, nullable=False, default=0)
-    idempotency_key = Column(String(128), nullable=True, index=True)
+    idempotency_key = Column(String(128), nullable=True)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     created_by_username = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -33,22 +34,42 @@ class MediaLoggerRun(Base):
     error = Column(Text, nullable=True)
 
     __table_args__ = (
-        Index("ix_media_logger_runs_status_created", "status", "created_at"),
+        UniqueConstraint("run_id", name="uq_media_logger_runs_run_id"),
+        Index(
+            "ix_media_logger_runs_status_created",
+            status,
+            created_at.desc(),
+            postgresql_include=[
+                "run_id",
+                "source_type",
+                "source_label",
+                "language_hint",
+                "segments_count",
+                "highlights_count",
+                "finished_at",
+            ],
+        ),
+        Index(
+            "ix_media_logger_runs_idempotency_key",
+            idempotency_key,
+            unique=True,
+            postgresql_where=idempotency_key.is_not(None) & (status != "failed"),
+        ),
     )
 
 
 class MediaLoggerSegment(Base):
     __tablename__ = "media_logger_segments"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False)
     segment_index = Column(Integer, nullable=False, index=True)
     start_sec = Column(Float, nullable=False)
     end_sec = Column(Float, nullable=False)
     text = Column(Text, nullable=False)
     confidence = Column(Float, nullable=True)
     speaker = Column(String(32), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_media_logger_segments_run_order", "run_id", "segment_index"),
@@ -60,14 +81,14 @@ class MediaLoggerHighlight(Base):
     __tablename__ = "media_logger_highlights"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False)
     rank = Column(Integer, nullable=False, default=1)
     quote = Column(Text, nullable=False)
     reason = Column(String(255), nullable=True)
     start_sec = Column(Float, nullable=False)
     end_sec = Column(Float, nullable=False)
     confidence = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_media_logger_highlights_run_rank", "run_id", "rank"),
@@ -77,12 +98,12 @@ class MediaLoggerHighlight(Base):
 class MediaLoggerJobEvent(Base):
     __tablename__ = "media_logger_job_events"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(String(64), ForeignKey("media_logger_runs.run_id", ondelete="CASCADE"), nullable=False)
     node = Column(String(64), nullable=False, index=True)
     event_type = Column(String(32), nullable=False, index=True)  # started|finished|failed|state_update
-    payload_json = Column(JSON, nullable=False, default=dict)
-    ts = Column(DateTime, default=datetime.utcnow, index=True)
+    payload_json = Column(JSONB, nullable=False, default=dict)
+    ts = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_media_logger_job_events_run_ts", "run_id", "ts"),
@@ -4,55 +4,79 @@ MSI (Media Stability Index) models.
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text, UniqueConstraint
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.database import Base
 
 
+# Native PostgreSQL enums, created by migration 20261017_msi_sim_enums.
+MSI_MODE = Enum("daily", "weekly", name="msi_mode", create_type=False)
+MSI_RUN_STATUS = Enum("queued", "running", "completed", "failed", name="msi_run_status", create_type=False)
+MSI_LEVEL = Enum("GREEN", "YELLOW", "ORANGE", "RED", name="msi_level", create_type=False)
+MSI_EVENT_TYPE = Enum("started", "finished", "failed", "state_update", name="msi_event_type", create_type=False)
+
+
 class MsiRun(Base):
     __tablename__ = "msi_runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), nullable=False, unique=True, index=True)
+    run_id = Column(String(64), nullable=False)
     profile_id = Column(String(64), nullable=False, index=True)
     entity = Column(String(255), nullable=False, index=True)
-    mode = Column(String(16), nullable=False, index=True)  # daily|weekly
+    mode = Column(MSI_MODE, nullable=False, index=True)
     period_start = Column(DateTime, nullable=False)
     period_end = Column(DateTime, nullable=False)
     timezone = Column(String(64), nullable=False, default="Africa/Algiers")
-    status = Column(String(24), nullable=False, default="queued", index=True)  # queued|running|completed|failed
+    status = Column(MSI_RUN_STATUS, nullable=False, default="queued")
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     created_by_username = Column(String(64), nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
     finished_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
 
+    __table_args__ = (
+        UniqueConstraint("run_id", name="uq_msi_runs_run_id"),
+        Index("ix_msi_runs_created_at", created_at, postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
+
 
 class MsiReport(Base):
     __tablename__ = "msi_reports"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
-    report_json = Column(JSON, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
+    report_json = Column(JSONB, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_msi_reports_created_at", created_at, postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
 
 class MsiTimeseries(Base):
     __tablename__ = "msi_timeseries"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    profile_id = Column(String(64), nullable=False, index=True)
-    entity = Column(String(255), nullable=False, index=True)
-    mode = Column(String(16), nullable=False, index=True)
-    period_end = Column(DateTime, nullable=False, index=True)
+    profile_id = Column(String(64), nullable=False)
+    entity = Column(String(255), nullable=False)
+    mode = Column(MSI_MODE, nullable=False)
+    period_end = Column(DateTime, nullable=False)
     msi = Column(Float, nullable=False)
-    level = Column(String(16), nullable=False)
-    components_json = Column(JSON, nullable=False)
+    level = Column(MSI_LEVEL, nullable=False)
+    components_json = Column(JSONB, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     __table_args__ = (
         UniqueConstraint("profile_id", "entity", "mode", "period_end", name="uq_msi_timeseries_point"),
-        Index("ix_msi_timeseries_lookup", "profile_id", "entity", "mode", "period_end"),
+        Index(
+            "ix_msi_timeseries_lookup",
+            "profile_id",
+            "entity",
+            "mode",
+            "period_end",
+            postgresql_include=["msi", "level"],
+        ),
     )
 
 
@@ -60,24 +84,25 @@ class MsiArtifact(Base):
     __tablename__ = "msi_artifacts"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
-    items_json = Column(JSON, nullable=False)
-    aggregates_json = Column(JSON, nullable=False)
+    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
+    items_json = Column(JSONB, nullable=False)
+    aggregates_json = Column(JSONB, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
 class MsiJobEvent(Base):
     __tablename__ = "msi_job_events"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(String(64), ForeignKey("msi_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
     node = Column(String(64), nullable=False, index=True)
-    event_type = Column(String(32), nullable=False, index=True)  # started|finished|failed|state_update
-    payload_json = Column(JSON, nullable=False, default=dict)
-    ts = Column(DateTime, default=datetime.utcnow, index=True)
+    event_type = Column(MSI_EVENT_TYPE, nullable=False, index=True)
+    payload_json = Column(JSONB, nullable=False, default=dict)
+    ts = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_msi_job_events_run_ts", "run_id", "ts"),
+        Index("ix_msi_job_events_ts", ts, postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
 
 
@@ -85,10 +110,10 @@ class MsiWatchlist(Base):
     __tablename__ = "msi_watchlist"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    profile_id = Column(String(64), nullable=False, index=True)
-    entity = Column(String(255), nullable=False, index=True)
-    aliases_json = Column(JSON, nullable=False, default=list)
-    enabled = Column(Boolean, nullable=False, default=True, index=True)
+    profile_id = Column(String(64), nullable=False)
+    entity = Column(String(255), nullable=False)
+    aliases_json = Column(JSONB, nullable=False, default=list)
+    enabled = Column(Boolean, nullable=False, default=True)
     run_daily = Column(Boolean, nullable=False, default=True)
     run_weekly = Column(Boolean, nullable=False, default=True)
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -98,6 +123,8 @@ class MsiWatchlist(Base):
 
     __table_args__ = (
         UniqueConstraint("profile_id", "entity", name="uq_msi_watchlist_profile_entity"),
+        Index("ix_msi_watchlist_daily", "updated_at", postgresql_where=enabled.is_(True) & run_daily.is_(True)),
+        Index("ix_msi_watchlist_weekly", "updated_at", postgresql_where=enabled.is_(True) & run_weekly.is_(True)),
     )
 
 
@@ -107,10 +134,10 @@ class MsiBaseline(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     profile_id = Column(String(64), nullable=False, index=True)
     entity = Column(String(255), nullable=False, index=True)
-    pressure_history = Column(JSON, nullable=False, default=list)
-    last_topic_dist = Column(JSON, nullable=False, default=dict)
+    pressure_history = Column(JSONB, nullable=False, default=list)
+    last_topic_dist = Column(JSONB, nullable=False, default=dict)
     baseline_window_days = Column(Integer, nullable=False, default=90)
-    last_updated = Column(DateTime, default=datetime.utcnow, index=True)
+    last_updated = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         UniqueConstraint("profile_id", "entity", name="uq_msi_baseline_profile_entity"),
@@ -9,7 +9,7 @@ import enum
 from datetime import datetime
 from sqlalchemy import (
     Column, Integer, String, Text, Float, Boolean, DateTime,
-    Enum, ForeignKey, Index, JSON, UniqueConstraint,
+    Enum, ForeignKey, Index, JSON, UniqueConstraint, func,
 )
 from sqlalchemy.orm import relationship
 from app.core.database import Base
@@ -153,6 +153,7 @@ class Article(Base):
         Index("ix_articles_status_category", "status", "category"),
         Index("ix_articles_crawled", "crawled_at"),
         Index("ix_articles_importance", "importance_score"),
+        Index("ix_articles_published_or_crawled_at", func.coalesce(published_at, crawled_at)),
     )
 
     def __repr__(self):
@@ -200,8 +201,8 @@ class EditorialDraft(Base):
     updated_by = Column(String(255), nullable=True)
     applied_by = Column(String(255), nullable=True)
     applied_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now())
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
 
     article = relationship("Article")
     parent_draft = relationship("EditorialDraft", remote_side=[id], uselist=False)
@@ -15,8 +15,8 @@ class ProjectMemoryItem(Base):
     __tablename__ = "project_memory_items"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    memory_type = Column(String(24), nullable=False, index=True, default="operational")  # operational|knowledge|session
-    memory_subtype = Column(String(48), nullable=True, index=True)
+    memory_type = Column(String(24), nullable=False, default="operational")  # operational|knowledge|session
+    memory_subtype = Column(String(48), nullable=True)
     title = Column(String(512), nullable=False)
     content = Column(Text, nullable=False)
     tags = Column(JSON, nullable=False, default=list)
@@ -49,7 +49,7 @@ class ProjectMemoryEvent(Base):
     __tablename__ = "project_memory_events"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    memory_id = Column(Integer, ForeignKey("project_memory_items.id"), nullable=False, index=True)
+    memory_id = Column(Integer, ForeignKey("project_memory_items.id"), nullable=False)
     event_type = Column(String(32), nullable=False, index=True)  # created|updated|used|archived|pinned
     note = Column(Text, nullable=True)
     actor_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
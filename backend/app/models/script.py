@@ -11,11 +11,11 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
-    JSON,
     String,
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -48,7 +48,7 @@ class ScriptProject(Base):
     __tablename__ = "script_projects"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    type = Column(Enum(ScriptProjectType, name="script_project_type", create_type=False), nullable=False, index=True)
+    type = Column(Enum(ScriptProjectType, name="script_project_type", create_type=False), nullable=False)
     status = Column(
         Enum(ScriptProjectStatus, name="script_project_status", create_type=False),
         nullable=False,
@@ -58,7 +58,7 @@ class ScriptProject(Base):
     story_id = Column(Integer, ForeignKey("stories.id", ondelete="SET NULL"), nullable=True, index=True)
     article_id = Column(Integer, ForeignKey("articles.id", ondelete="SET NULL"), nullable=True, index=True)
     title = Column(String(1024), nullable=False)
-    params_json = Column(JSON, nullable=False, default=dict)
+    params_json = Column(JSONB, nullable=False, default=dict)
     created_by = Column(String(128), nullable=True)
     updated_by = Column(String(128), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -86,12 +86,12 @@ class ScriptOutput(Base):
     __tablename__ = "script_outputs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    script_id = Column(Integer, ForeignKey("script_projects.id", ondelete="CASCADE"), nullable=False, index=True)
+    script_id = Column(Integer, ForeignKey("script_projects.id", ondelete="CASCADE"), nullable=False)
     version = Column(Integer, nullable=False, default=1)
-    content_json = Column(JSON, nullable=True)
+    content_json = Column(JSONB, nullable=True)
     content_text = Column(Text, nullable=True)
     format = Column(Enum(ScriptOutputFormat, name="script_output_format", create_type=False), nullable=False, default=ScriptOutputFormat.json)
-    quality_issues_json = Column(JSON, nullable=False, default=list)
+    quality_issues_json = Column(JSONB, nullable=False, default=list)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     project = relationship("ScriptProject", back_populates="outputs")
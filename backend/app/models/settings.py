@@ -5,7 +5,7 @@ Stores external API credentials and service configuration.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, func
 
 from app.core.database import Base
 
@@ -19,4 +19,4 @@ class ApiSetting(Base):
     value = Column(Text, nullable=True)
     description = Column(Text, nullable=True)
     is_secret = Column(Boolean, default=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow, server_default=func.now(), onupdate=datetime.utcnow)
@@ -4,31 +4,41 @@ Audience Simulator models.
 
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.core.database import Base
 
 
+# Native PostgreSQL enums, created by migration 20261017_msi_sim_enums.
+SIM_PLATFORM = Enum("facebook", "x", name="sim_platform", create_type=False)
+SIM_MODE = Enum("fast", "deep", name="sim_mode", create_type=False)
+SIM_RUN_STATUS = Enum("queued", "running", "completed", "failed", name="sim_run_status", create_type=False)
+SIM_EVENT_TYPE = Enum("started", "finished", "failed", "state_update", name="sim_event_type", create_type=False)
+SIM_FEEDBACK_ACTION = Enum("accept", "edit", "ignore", name="sim_feedback_action", create_type=False)
+
+
 class SimRun(Base):
     __tablename__ = "sim_runs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), nullable=False, unique=True, index=True)
+    run_id = Column(String(64), nullable=False)
     article_id = Column(Integer, ForeignKey("articles.id"), nullable=True, index=True)
     draft_id = Column(Integer, ForeignKey("editorial_drafts.id"), nullable=True, index=True)
     headline = Column(String(1024), nullable=False)
     body_excerpt = Column(Text, nullable=True)
-    platform = Column(String(16), nullable=False, default="facebook", index=True)  # facebook|x
-    mode = Column(String(16), nullable=False, default="fast", index=True)  # fast|deep
-    status = Column(String(24), nullable=False, default="queued", index=True)  # queued|running|completed|failed
+    platform = Column(SIM_PLATFORM, nullable=False, default="facebook", index=True)
+    mode = Column(SIM_MODE, nullable=False, default="fast", index=True)
+    status = Column(SIM_RUN_STATUS, nullable=False, default="queued")
     created_by_user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     created_by_username = Column(String(64), nullable=True)
-    idempotency_key = Column(String(128), nullable=True, index=True)
+    idempotency_key = Column(String(128), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
     finished_at = Column(DateTime, nullable=True)
     error = Column(Text, nullable=True)
 
     __table_args__ = (
+        UniqueConstraint("run_id", name="uq_sim_runs_run_id"),
         Index("ix_sim_runs_status_created", "status", "created_at"),
     )
 
@@ -37,14 +47,14 @@ class SimResult(Base):
     __tablename__ = "sim_results"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
     risk_score = Column(Float, nullable=False)
     virality_score = Column(Float, nullable=False)
     confidence_score = Column(Float, nullable=False, default=0.0)
-    breakdown_json = Column(JSON, nullable=False, default=dict)
-    reactions_json = Column(JSON, nullable=False, default=list)
-    advice_json = Column(JSON, nullable=False, default=dict)
-    red_flags_json = Column(JSON, nullable=False, default=dict)
+    breakdown_json = Column(JSONB, nullable=False, default=dict)
+    reactions_json = Column(JSONB, nullable=False, default=list)
+    advice_json = Column(JSONB, nullable=False, default=dict)
+    red_flags_json = Column(JSONB, nullable=False, default=dict)
     created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 
@@ -52,8 +62,8 @@ class SimFeedback(Base):
     __tablename__ = "sim_feedback"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
-    action = Column(String(32), nullable=False, index=True)  # accept|edit|ignore
+    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
+    action = Column(SIM_FEEDBACK_ACTION, nullable=False, index=True)
     editor_notes = Column(Text, nullable=True)
     editor_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     editor_username = Column(String(64), nullable=True)
@@ -64,24 +74,29 @@ class SimCalibration(Base):
     __tablename__ = "sim_calibration"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    platform = Column(String(16), nullable=False, index=True)
-    bucket = Column(String(32), nullable=False, index=True)
+    platform = Column(SIM_PLATFORM, nullable=False)
+    bucket = Column(String(32), nullable=False)
     actual_ctr = Column(Float, nullable=True)
     actual_backlash = Column(Float, nullable=True)
     actual_shares = Column(Float, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, index=True)
 
+    __table_args__ = (
+        UniqueConstraint("platform", "bucket", name="uq_sim_calibration_key"),
+    )
+
 
 class SimJobEvent(Base):
     __tablename__ = "sim_job_events"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    run_id = Column(String(64), ForeignKey("sim_runs.run_id", ondelete="CASCADE", deferrable=True, initially="IMMEDIATE"), nullable=False)
     node = Column(String(64), nullable=False, index=True)
-    event_type = Column(String(32), nullable=False, index=True)  # started|finished|failed|state_update
-    payload_json = Column(JSON, nullable=False, default=dict)
-    ts = Column(DateTime, default=datetime.utcnow, index=True)
+    event_type = Column(SIM_EVENT_TYPE, nullable=False, index=True)
+    payload_json = Column(JSONB, nullable=False, default=dict)
+    ts = Column(DateTime, default=datetime.utcnow)
 
     __table_args__ = (
         Index("ix_sim_job_events_run_ts", "run_id", "ts"),
+        Index("ix_sim_job_events_ts", ts, postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
     )
@@ -7,7 +7,7 @@ import json
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
-from sqlalchemy import desc, func, select
+from sqlalchemy import Row, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
@@ -278,7 +278,7 @@ class MsiMonitorService:
         )
         return list(reversed(rows.scalars().all()))
 
-    async def get_top_entities(self, db: AsyncSession, mode: str, limit: int = 5) -> list[MsiTimeseries]:
+    async def get_top_entities(self, db: AsyncSession, mode: str, limit: int = 5) -> list[Row]:
         subquery = (
             select(
                 MsiTimeseries.profile_id,
@@ -290,8 +290,17 @@ class MsiMonitorService:
             .group_by(MsiTimeseries.profile_id, MsiTimeseries.entity, MsiTimeseries.mode)
             .subquery()
         )
+        # Only columns held by ix_msi_timeseries_lookup (key + INCLUDE), so both sides
+        # of the join are index-only scans.
         rows = await db.execute(
-            select(MsiTimeseries)
+            select(
+                MsiTimeseries.profile_id,
+                MsiTimeseries.entity,
+                MsiTimeseries.mode,
+                MsiTimeseries.period_end,
+                MsiTimeseries.msi,
+                MsiTimeseries.level,
+            )
             .join(
                 subquery,
                 (MsiTimeseries.profile_id == subquery.c.profile_id)
@@ -302,12 +311,21 @@ class MsiMonitorService:
             .order_by(MsiTimeseries.msi.asc())
             .limit(limit)
         )
-        return rows.scalars().all()
+        return rows.all()
 
-    async def list_watchlist(self, db: AsyncSession, enabled_only: bool = False) -> list[MsiWatchlist]:
+    async def list_watchlist(
+        self,
+        db: AsyncSession,
+        enabled_only: bool = False,
+        mode: str | None = None,
+    ) -> list[MsiWatchlist]:
         query = select(MsiWatchlist).order_by(MsiWatchlist.updated_at.desc())
         if enabled_only:
             query = query.where(MsiWatchlist.enabled.is_(True))
+        if mode == "daily":
+            query = query.where(MsiWatchlist.run_daily.is_(True))
+        elif mode == "weekly":
+            query = query.where(MsiWatchlist.run_weekly.is_(True))
         rows = await db.execute(query)
         return rows.scalars().all()
 
@@ -392,14 +410,10 @@ class MsiMonitorService:
 
     async def run_watchlist_mode(self, mode: str) -> dict:
         async with async_session() as db:
-            items = await self.list_watchlist(db, enabled_only=True)
+            items = await self.list_watchlist(db, enabled_only=True, mode=mode)
             triggered = 0
             queued = 0
             for item in items:
-                if mode == "daily" and not item.run_daily:
-                    continue
-                if mode == "weekly" and not item.run_weekly:
-                    continue
                 run = await self.create_run(
                     db,
                     profile_id=item.profile_id,
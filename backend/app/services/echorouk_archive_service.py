@@ -373,7 +373,7 @@ class EchoroukArchiveService:
         stmt = (
             select(
                 Article,
-                ArticleVector.embedding.cosine_distance(query_vec).label("dist"),
+                ArticleVector.embedding_half.cosine_distance(query_vec).label("dist"),
             )
             .join(ArticleVector, ArticleVector.article_id == Article.id)
             .join(ArticleProfile, ArticleProfile.article_id == Article.id)
@@ -381,7 +381,7 @@ class EchoroukArchiveService:
                 ArticleVector.vector_type.in_(["title", "summary"]),
                 text("article_profiles.metadata_json ->> 'corpus' = 'echorouk_archive'"),
             )
-            .order_by(ArticleVector.embedding.cosine_distance(query_vec))
+            .order_by(ArticleVector.embedding_half.cosine_distance(query_vec))
             .limit(max(limit * 4, 20))
         )
         rows = await db.execute(stmt)
@@ -16,7 +16,8 @@ from hashlib import sha1
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import delete, desc, select
+from sqlalchemy import delete, desc, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import async_session
@@ -32,6 +33,12 @@ from app.services.ai_service import ai_service
 
 logger = get_logger("media_logger.service")
 
+# Predicate of ix_media_logger_runs_idempotency_key. It must stay a literal: Postgres only
+# matches a bound `status <> $n` to the partial index in custom plans, and asyncpg's cached
+# statements switch to a generic plan after five executions, where ON CONFLICT then
+# finds no matching unique index.
+LIVE_IDEMPOTENCY_KEY = text("idempotency_key IS NOT NULL AND status <> 'failed'")
+
 
 class MediaLoggerService:
     def __init__(self) -> None:
@@ -66,6 +73,29 @@ class MediaLoggerService:
         suffix = abs(hash((seed, datetime.utcnow().isoformat()))) % 10_000_000
         return f"MLG-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}-{suffix:07d}"
 
+    async def _claim_run(self, db: AsyncSession, idem: str, **values: Any) -> tuple[MediaLoggerRun, bool]:
+        # Queued/running/completed runs own their key through a partial unique index, so
+        # the insert either creates the run or yields to the live one in a single round
+        # trip; a failed run leaves its key free for a retry. The loop only repeats if the
+        # conflicting run fails between the two statements.
+        while True:
+            run = await db.scalar(
+                pg_insert(MediaLoggerRun)
+                .values(status="queued", idempotency_key=idem, **values)
+                .on_conflict_do_nothing(
+                    index_elements=[MediaLoggerRun.idempotency_key],
+                    index_where=LIVE_IDEMPOTENCY_KEY,
+                )
+                .returning(MediaLoggerRun)
+            )
+            if run is not None:
+                return run, True
+            existing = await db.scalar(
+                select(MediaLoggerRun).where(MediaLoggerRun.idempotency_key == idem).where(LIVE_IDEMPOTENCY_KEY)
+            )
+            if existing is not None:
+                return existing, False
+
     async def create_run_from_url(
         self,
         db: AsyncSession,
@@ -78,30 +108,18 @@ class MediaLoggerService:
         norm_lang = self._normalize_language(language_hint)
         idem = idempotency_key or self._build_url_idempotency(media_url, norm_lang, actor.id if actor else None)
 
-        existing_row = await db.execute(
-            select(MediaLoggerRun)
-            .where(MediaLoggerRun.idempotency_key == idem)
-            .order_by(MediaLoggerRun.created_at.desc())
-            .limit(1)
-        )
-        existing = existing_row.scalar_one_or_none()
-        if existing and existing.status in {"queued", "running", "completed"}:
-            return existing
-
-        run = MediaLoggerRun(
+        run, _created = await self._claim_run(
+            db,
+            idem,
             run_id=self._run_id(media_url),
             source_type="url",
             source_ref=media_url.strip(),
             source_label=media_url.strip(),
             language_hint=norm_lang,
-            status="queued",
-            idempotency_key=idem,
             created_by_user_id=actor.id if actor else None,
             created_by_username=actor.username if actor else "system",
         )
-        db.add(run)
         await db.commit()
-        await db.refresh(run)
         return run
 
     async def create_run_from_upload(
@@ -118,34 +136,22 @@ class MediaLoggerService:
         safe_name = self._safe_filename(filename)
         idem = idempotency_key or self._build_upload_idempotency(safe_name, payload, norm_lang, actor.id if actor else None)
 
-        existing_row = await db.execute(
-            select(MediaLoggerRun)
-            .where(MediaLoggerRun.idempotency_key == idem)
-            .order_by(MediaLoggerRun.created_at.desc())
-            .limit(1)
-        )
-        existing = existing_row.scalar_one_or_none()
-        if existing and existing.status in {"queued", "running", "completed"}:
-            return existing
-
         run_id = self._run_id(safe_name)
         source_path = self._workdir / f"{run_id}-source-{safe_name}"
-        source_path.write_bytes(payload)
-
-        run = MediaLoggerRun(
+        run, created = await self._claim_run(
+            db,
+            idem,
             run_id=run_id,
             source_type="upload",
             source_ref=str(source_path),
             source_label=safe_name,
             language_hint=norm_lang,
-            status="queued",
-            idempotency_key=idem,
             created_by_user_id=actor.id if actor else None,
             created_by_username=actor.username if actor else "system",
         )
-        db.add(run)
+        if created:
+            source_path.write_bytes(payload)
         await db.commit()
-        await db.refresh(run)
         return run
 
     async def start_run_task(self, run_id: str) -> None:
@@ -399,24 +405,27 @@ class MediaLoggerService:
         limit: int = 20,
         status: str | None = None,
     ) -> list[dict]:
-        query = select(MediaLoggerRun).order_by(desc(MediaLoggerRun.created_at)).limit(limit)
+        # Only the listed columns are read (never transcript_text), which are exactly the
+        # key and INCLUDE columns of ix_media_logger_runs_status_created.
+        query = (
+            select(
+                MediaLoggerRun.run_id,
+                MediaLoggerRun.status,
+                MediaLoggerRun.source_type,
+                MediaLoggerRun.source_label,
+                MediaLoggerRun.language_hint,
+                MediaLoggerRun.segments_count,
+                MediaLoggerRun.highlights_count,
+                MediaLoggerRun.created_at,
+                MediaLoggerRun.finished_at,
+            )
+            .order_by(desc(MediaLoggerRun.created_at))
+            .limit(limit)
+        )
         if status:
             query = query.where(MediaLoggerRun.status == status)
         rows = await db.execute(query)
-        return [
-            {
-                "run_id": r.run_id,
-                "status": r.status,
-                "source_type": r.source_type,
-                "source_label": r.source_label,
-                "language_hint": r.language_hint,
-                "segments_count": r.segments_count,
-                "highlights_count": r.highlights_count,
-                "created_at": r.created_at,
-                "finished_at": r.finished_at,
-            }
-            for r in rows.scalars().all()
-        ]
+        return [dict(r) for r in rows.mappings().all()]
 
     async def get_events_since(
         self,
@@ -15,7 +15,7 @@ from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Iterable
 
-from sqlalchemy import and_, desc, func, select
+from sqlalchemy import and_, desc, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
@@ -110,6 +110,11 @@ def _to_unsigned64(v: int) -> int:
     return v if v >= 0 else v + (1 << 64)
 
 
+def _simhash_bands(v: int) -> tuple[int, int, int, int]:
+    """16-bit bands of an unsigned simhash, high to low (matches ArticleFingerprint.simhash_b*)."""
+    return tuple((v >> shift) & 0xFFFF for shift in (48, 32, 16, 0))
+
+
 def _hamming_ratio(a: int, b: int, bits: int = 64) -> float:
     dist = (a ^ b).bit_count()
     return 1.0 - (dist / float(bits))
@@ -244,6 +249,30 @@ class NewsKnowledgeService:
             .limit(1000)
         )
         candidates = rows.all()
+
+        # Near-duplicates older than the 1000 most recent rows still share a simhash band.
+        seen_ids = {fp.article_id for fp, _ in candidates}
+        b0, b1, b2, b3 = _simhash_bands(article_simhash)
+        band_rows = await db.execute(
+            select(ArticleFingerprint, Article)
+            .join(Article, Article.id == ArticleFingerprint.article_id)
+            .where(
+                and_(
+                    ArticleFingerprint.article_id != article.id,
+                    ArticleFingerprint.article_id.notin_(seen_ids),
+                    Article.crawled_at >= window_start,
+                    or_(
+                        ArticleFingerprint.simhash_b0 == b0,
+                        ArticleFingerprint.simhash_b1 == b1,
+                        ArticleFingerprint.simhash_b2 == b2,
+                        ArticleFingerprint.simhash_b3 == b3,
+                    ),
+                )
+            )
+            .order_by(Article.crawled_at.desc())
+            .limit(200)
+        )
+        candidates.extend(band_rows.all())
         if not candidates:
             await self._ensure_single_cluster(db, article, label=article.title_ar or article.original_title)
             return
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.services.media_logger_service import MediaLoggerService
+
+
+class _DbStub:
+    def __init__(self, results):
+        self._results = list(results)
+        self.statements = []
+
+    async def scalar(self, stmt):
+        if not self._results:
+            raise AssertionError("Unexpected scalar call")
+        self.statements.append(stmt)
+        return self._results.pop(0)
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_claim_run_inserts_new_key():
+    svc = MediaLoggerService()
+    inserted = SimpleNamespace(run_id="MLG-1")
+    db = _DbStub([inserted])
+
+    run, created = await svc._claim_run(db, "key-1", run_id="MLG-1", source_type="url", source_ref="https://x")
+
+    assert run is inserted
+    assert created is True
+    assert len(db.statements) == 1
+    sql = _sql(db.statements[0])
+    assert "ON CONFLICT (idempotency_key) WHERE idempotency_key IS NOT NULL AND status <> 'failed' DO NOTHING" in sql
+
+
+@pytest.mark.asyncio
+async def test_claim_run_returns_live_run_for_existing_key():
+    svc = MediaLoggerService()
+    existing = SimpleNamespace(run_id="MLG-0", status="running")
+    db = _DbStub([None, existing])
+
+    run, created = await svc._claim_run(db, "key-1", run_id="MLG-2", source_type="url", source_ref="https://x")
+
+    assert run is existing
+    assert created is False
+    lookup = _sql(db.statements[1])
+    assert "idempotency_key IS NOT NULL AND status <> 'failed'" in lookup
+
+
+@pytest.mark.asyncio
+async def test_claim_run_reuses_key_of_failed_run():
+    # The conflicting run failed before the lookup: it no longer owns the key, so the
+    # insert is retried and creates a fresh run.
+    svc = MediaLoggerService()
+    inserted = SimpleNamespace(run_id="MLG-3")
+    db = _DbStub([None, None, inserted])
+
+    run, created = await svc._claim_run(db, "key-1", run_id="MLG-3", source_type="url", source_ref="https://x")
+
+    assert run is inserted
+    assert created is True
+    assert len(db.statements) == 3
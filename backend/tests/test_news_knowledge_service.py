@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.models.knowledge import ArticleFingerprint
+from app.services.news_knowledge_service import (
+    NewsKnowledgeService,
+    _simhash_bands,
+    _to_signed64,
+    _to_unsigned64,
+)
+
+_BAND_SQL = re.compile(r"^\(\(simhash >> (\d+)\) & (\d+)\)::integer$")
+
+
+def _sql_band(column: str, stored: int) -> int:
+    # Evaluate the generated-column expression on the signed bigint Postgres stores.
+    # Python's >> on negative ints is arithmetic, like Postgres's bigint >>.
+    sqltext = str(ArticleFingerprint.__table__.c[column].computed.sqltext)
+    match = _BAND_SQL.match(sqltext)
+    assert match, sqltext
+    shift, mask = (int(group) for group in match.groups())
+    return (stored >> shift) & mask
+
+
+@pytest.mark.parametrize(
+    "simhash",
+    [
+        0,
+        1234567890123,
+        (1 << 63) - 1,
+        1 << 63,
+        0xFEDCBA9876543210,
+        (1 << 64) - 1,
+    ],
+)
+def test_simhash_bands_match_generated_columns(simhash):
+    stored = _to_signed64(simhash)
+
+    expected = tuple(_sql_band(f"simhash_b{band}", stored) for band in range(4))
+
+    assert _simhash_bands(simhash) == expected
+    assert _simhash_bands(_to_unsigned64(stored)) == expected
+
+
+def test_simhash_bands_of_negative_stored_value():
+    # -1 as a signed bigint is all 64 bits set.
+    assert _simhash_bands(_to_unsigned64(-1)) == (0xFFFF, 0xFFFF, 0xFFFF, 0xFFFF)
+    assert _sql_band("simhash_b0", -1) == 0xFFFF
+
+
+class _Stop(Exception):
+    pass
+
+
+class _DbStub:
+    def __init__(self, results):
+        self._results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if not self._results:
+            raise _Stop
+        return SimpleNamespace(all=lambda rows=self._results.pop(0): list(rows))
+
+
+@pytest.mark.asyncio
+async def test_band_lookup_skips_recent_rows_and_keeps_newest():
+    # The band query must not spend its LIMIT on rows the recency scan already returned.
+    recent = (SimpleNamespace(article_id=7), SimpleNamespace(id=7))
+    db = _DbStub([[recent], []])
+    article = SimpleNamespace(id=1, title_ar=None, original_title="t", crawled_at=datetime.utcnow())
+
+    with pytest.raises(_Stop):
+        await NewsKnowledgeService()._cluster_and_link(db, article, 12345, set())
+
+    sql = str(db.statements[1].compile(dialect=postgresql.dialect()))
+    assert "article_fingerprints.article_id NOT IN" in sql
+    assert sql.index("ORDER BY articles.crawled_at DESC") < sql.index("LIMIT")
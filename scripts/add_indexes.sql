@@ -10,8 +10,8 @@ CREATE INDEX IF NOT EXISTS ix_articles_title_ar_trgm
 ON articles USING gin (title_ar gin_trgm_ops);
 
 -- 2) Common sort paths
-CREATE INDEX IF NOT EXISTS ix_articles_published_at
-ON articles (published_at DESC);
+CREATE INDEX IF NOT EXISTS ix_articles_published_or_crawled_at
+ON articles (coalesce(published_at, crawled_at));
 
 CREATE INDEX IF NOT EXISTS ix_articles_candidate_order
 ON articles (status, importance_score DESC, crawled_at DESC);
@@ -0,0 +1,16 @@
+-- Rebuild the ANN index on article_vectors around bulk embedding loads.
+--
+-- Maintaining the ANN index row by row dominates insert cost during large ingests
+-- (archive backfills, re-embedding with a new model). Run step 1 before the load
+-- and step 2 after it. Requires pgvector >= 0.7 (halfvec), like the migrations.
+
+-- 1) Before the bulk load
+DROP INDEX CONCURRENTLY IF EXISTS ix_article_vectors_embedding_half_hnsw;
+
+-- 2) After the bulk load: HNSW over the FP16 expression that
+-- ArticleVector.embedding_half queries with (20261017_article_vectors_hnsw).
+ANALYZE article_vectors;
+SET maintenance_work_mem = '1GB';
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_article_vectors_embedding_half_hnsw
+ON article_vectors USING hnsw ((embedding::halfvec(256)) halfvec_cosine_ops) WITH (m = 16, ef_construction = 64);
+RESET maintenance_work_mem;
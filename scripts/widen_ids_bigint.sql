@@ -0,0 +1,98 @@
+-- Widen an integer `id` primary key to bigint on a live database.
+--
+-- New databases create these ids as bigint (see the create_table definitions in
+-- alembic/versions). Databases created before that still have integer ids, and
+-- `ALTER COLUMN id TYPE bigint` would rewrite the whole table under ACCESS EXCLUSIVE.
+-- This script fills a shadow bigint column while the app keeps writing, then swaps
+-- it in with a catalog-only transaction.
+--
+-- Tables:
+--   msi_job_events, sim_job_events,
+--   competitor_xray_items, competitor_xray_events,
+--   media_logger_segments, media_logger_job_events,
+--   link_recommendation_items, link_click_events
+--
+-- Only for tables whose id is referenced by nothing but their own primary key.
+-- Run it once per table with psql in autocommit mode (the default):
+--   psql -v tbl=msi_job_events -f scripts/widen_ids_bigint.sql
+-- If it stops before step 4, run it again from the top.
+
+\set ON_ERROR_STOP on
+SELECT :'tbl' || '_id_seq' AS seq,
+       :'tbl' || '_pkey' AS pkey,
+       :'tbl' || '_id_new_key' AS idx,
+       'ck_' || :'tbl' || '_id_new_not_null' AS ck \gset
+SELECT set_config('widen.tbl', :'tbl', false);
+
+-- 1) Shadow column, kept in step with inserts and updates.
+CREATE OR REPLACE FUNCTION widen_id_sync() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.id_new := NEW.id;
+    RETURN NEW;
+END $$;
+
+BEGIN;
+SET LOCAL lock_timeout = '3s';
+ALTER TABLE :"tbl" ADD COLUMN IF NOT EXISTS id_new bigint;
+CREATE OR REPLACE TRIGGER widen_id_sync BEFORE INSERT OR UPDATE ON :"tbl"
+FOR EACH ROW EXECUTE FUNCTION widen_id_sync();
+COMMIT;
+
+-- 2) Backfill existing rows, committing every 10000 ids.
+DO $$
+DECLARE
+    tbl text := current_setting('widen.tbl');
+    lo bigint;
+    hi bigint;
+BEGIN
+    EXECUTE format('SELECT min(id), max(id) FROM %I WHERE id_new IS NULL', tbl) INTO lo, hi;
+    WHILE lo <= hi LOOP
+        EXECUTE format('UPDATE %I SET id_new = id WHERE id_new IS NULL AND id >= $1 AND id < $2', tbl)
+        USING lo, lo + 10000;
+        COMMIT;
+        lo := lo + 10000;
+    END LOOP;
+END $$;
+
+-- 3) Unique index and a NOT NULL proof for the new key, built without blocking writes.
+SELECT EXISTS (
+    SELECT 1 FROM pg_index WHERE indexrelid = to_regclass(:'idx') AND NOT indisvalid
+) AS idx_invalid \gset
+\if :idx_invalid
+-- Leftover from an interrupted concurrent build.
+DROP INDEX CONCURRENTLY :"idx";
+\endif
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS :"idx" ON :"tbl" (id_new);
+
+BEGIN;
+SET LOCAL lock_timeout = '3s';
+ALTER TABLE :"tbl"
+    DROP CONSTRAINT IF EXISTS :"ck",
+    ADD CONSTRAINT :"ck" CHECK (id_new IS NOT NULL) NOT VALID;
+COMMIT;
+ALTER TABLE :"tbl" VALIDATE CONSTRAINT :"ck";
+
+-- 4) Swap. Every statement is catalog-only: SET NOT NULL is proven by the validated
+-- check, the primary key reuses the unique index, and DROP COLUMN does not rewrite.
+BEGIN;
+SET LOCAL lock_timeout = '3s';
+DROP TRIGGER widen_id_sync ON :"tbl";
+ALTER TABLE :"tbl" ALTER COLUMN id_new SET NOT NULL;
+ALTER SEQUENCE :"seq" AS bigint OWNED BY :"tbl".id_new;
+ALTER TABLE :"tbl"
+    ALTER COLUMN id DROP DEFAULT,
+    ALTER COLUMN id_new SET DEFAULT nextval(:'seq'::regclass),
+    DROP CONSTRAINT :"pkey",
+    ADD CONSTRAINT :"pkey" PRIMARY KEY USING INDEX :"idx";
+ALTER TABLE :"tbl" DROP COLUMN id;
+ALTER TABLE :"tbl" RENAME COLUMN id_new TO id;
+ALTER TABLE :"tbl" DROP CONSTRAINT :"ck";
+COMMIT;
+
+-- The trigger function is shared; drop it once no table still uses it.
+SELECT NOT EXISTS (
+    SELECT 1 FROM pg_trigger WHERE tgfoid = 'widen_id_sync()'::regprocedure
+) AS sync_unused \gset
+\if :sync_unused
+DROP FUNCTION widen_id_sync();
+\endif